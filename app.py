@@ -1,11 +1,15 @@
-from flask import Flask, jsonify, render_template, request, Response
-import requests
-import json
+from flask import Flask, render_template, request
 import os
 from datetime import datetime
 
 from scrapers.service import ScraperService
 from scrapers.registry import provider_registry
+from scrapers.search import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, paginate
+from scrapers.utils import normalize_text
+from scrapers.store import EventStore, SnapshotRefresher, publish_snapshot
+from scrapers.providers.livetv import LiveTVProvider
+from proxy import proxy_response
+from response_cache import FAST_BROTLI_QUALITY, FAST_GZIP_LEVEL, VersionedResponseCache
 from dataclasses import asdict
 
 # Ubicación del archivo de caché
@@ -16,29 +20,56 @@ app = Flask(__name__)
 # Instanciamos el servicio de scrapers para generar eventos si no hay caché
 service = ScraperService(provider_registry)
 
+# Snapshot de eventos en memoria; solo se vuelve a parsear cuando cambia el fichero
+event_store = EventStore(CACHE_FILE)
+
+# Instancia compartida para /stream (mantiene su sesión HTTP con keep-alive)
+livetv_provider = LiveTVProvider()
+
+# Segundos que una petición espera al refresco compartido con la caché vacía
+COLD_START_WAIT = 3
+
+# Página principal ya renderizada (y comprimida) por versión del snapshot
+index_page = VersionedResponseCache("index", "text/html; charset=utf-8")
+
+# Filas por bloque de provider en la página principal; el resto se pide a /api/events
+INDEX_PAGE_SIZE = 10
+
+# Parámetros de /api/events; sin ninguno se devuelve la lista completa como antes
+API_QUERY_PARAMS = ("provider", "league", "q", "page", "page_size")
+
+# /api/events ya serializado y comprimido: la lista completa por versión del
+# snapshot y las consultas paginadas por (versión, consulta). Muchas consultas
+# (búsqueda mientras se escribe) se piden una sola vez: compresión rápida
+events_api = VersionedResponseCache("events", "application/json")
+events_query_api = VersionedResponseCache(
+    "events-q",
+    "application/json",
+    max_entries=256,
+    gzip_level=FAST_GZIP_LEVEL,
+    brotli_quality=FAST_BROTLI_QUALITY,
+)
+
+
+def refresh_snapshot():
+    events = service.build_events()
+    publish_snapshot(CACHE_FILE, [asdict(e) for e in events])
+
+
+# Un único refresco en segundo plano compartido por todas las peticiones
+refresher = SnapshotRefresher(event_store, refresh_snapshot)
+
 
 def load_events():
-    # 1. Intentar leer la caché
-    if os.path.exists(CACHE_FILE):
-        try:
-            with open(CACHE_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                if data:
-                    return data
-        except Exception:
-            pass
-
-    # 2. Si no hay datos, ejecutar los scrapers y escribir cache
-    try:
-        events = service.build_events()
-        data = [asdict(e) for e in events]
-        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
-        with open(CACHE_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+    # 1. Leer el snapshot en memoria (se recarga solo si el worker publicó uno nuevo)
+    data = event_store.get()
+    if data:
         return data
-    except Exception as e:
-        print(f"Error generando eventos: {e}")
-        return []
+
+    # 2. Caché vacía: nunca se hace scraping dentro de la petición. Se lanza
+    #    (o se reutiliza) un refresco en segundo plano y se espera un poco.
+    refresher.trigger_and_wait(COLD_START_WAIT)
+    return event_store.get()
 
 
 # Filtro de plantilla para convertir timestamps a fechas legibles
@@ -53,21 +84,15 @@ def datetime_filter(ts):
         return "Hoy"  # Cambiado de "-" a "Hoy"
 
 
-# Proxy para esquivar bloqueos de referer
+# Proxy para esquivar bloqueos de referer (streaming por trozos y modo HLS, ver proxy.py)
 @app.route("/proxy")
 def proxy():
     target = request.args.get("u")
     if not target:
         return "Missing URL", 400
 
-    headers = {
-        "User-Agent": "Mozilla/5.0",
-        "Referer": "https://kevinsport.digital/"
-    }
-
     try:
-        r = requests.get(target, headers=headers, timeout=10)
-        return Response(r.content, content_type=r.headers.get("Content-Type"))
+        return proxy_response(target, request.headers)
     except Exception as e:
         return f"Error al cargar el stream: {e}", 500
 
@@ -75,14 +100,59 @@ def proxy():
 # Página principal
 @app.route("/")
 def index():
-    events = load_events()
-    return render_template("index.html", events=events, title="Inicio")
+    load_events()
+    # Versión y eventos del mismo snapshot: la página cacheada nunca mezcla dos
+    snapshot = event_store.current()
+    return index_page.response(
+        snapshot.version,
+        lambda: render_template(
+            "index.html",
+            blocks=provider_blocks(snapshot),
+            page_size=INDEX_PAGE_SIZE,
+            title="Inicio",
+        ),
+        request,
+    )
+
+
+def provider_blocks(snapshot):
+    """(provider, primera página, total) por provider, en orden alfabético."""
+    return [
+        (provider, items[:INDEX_PAGE_SIZE], len(items))
+        for provider, items in sorted(snapshot.by_provider.items())
+    ]
 
 
-# Endpoint opcional para consultar eventos vía AJAX
+# Eventos vía AJAX: filtros, búsqueda y paginación en el servidor
 @app.route("/api/events")
 def api_events():
-    return jsonify(load_events())
+    load_events()
+    snapshot = event_store.current()
+
+    if not any(name in request.args for name in API_QUERY_PARAMS):
+        return events_api.response(
+            snapshot.version, lambda: to_json(snapshot.events), request
+        )
+
+    # Consultas equivalentes ("LiveTV" / "livetv ") comparten entrada de caché
+    provider = normalize_text(request.args.get("provider", ""))
+    league = normalize_text(request.args.get("league", ""))
+    q = normalize_text(request.args.get("q", ""))
+    page = max(1, request.args.get("page", 1, type=int))
+    page_size = min(max(1, request.args.get("page_size", DEFAULT_PAGE_SIZE, type=int)), MAX_PAGE_SIZE)
+
+    def render():
+        items = snapshot.search.query(provider=provider, league=league, q=q)
+        return to_json(paginate(items, page=page, page_size=page_size))
+
+    return events_query_api.response(
+        (snapshot.version, provider, league, q, page, page_size), render, request
+    )
+
+
+def to_json(data) -> str:
+    """Mismo JSON que jsonify() (compacto), para guardarlo ya serializado."""
+    return app.json.dumps(data, separators=(",", ":")) + "\n"
 
 
 # Página de stream individual
@@ -92,11 +162,12 @@ def stream():
     source = request.args.get("source")
     event_id = request.args.get("event")
 
-    # Cargar eventos desde cache
-    events = load_events()
-
-    # Buscar el evento seleccionado
-    event_obj = next((e for e in events if str(e.get("id")) == str(event_id)), None)
+    # Buscar el evento seleccionado en el índice del snapshot
+    event_obj = event_store.find(event_id)
+    if not event_obj and not event_store.events:
+        # Sin snapshot todavía: load_events espera al refresco compartido
+        load_events()
+        event_obj = event_store.find(event_id)
 
     if not event_obj:
         return "Evento no encontrado", 404
@@ -106,12 +177,8 @@ def stream():
 
     # Recargar streams para LiveTV si es necesario
     if source and "livetv" in source.lower():
-        from scrapers.providers.livetv import LiveTVProvider
-        from scrapers.models import Stream
-        
-        provider = LiveTVProvider()
         # load_streams devuelve objetos Stream, los convertimos a dict
-        stream_objects = provider.load_streams(event_obj["url"])
+        stream_objects = livetv_provider.load_streams(event_obj["url"])
         event_streams = [asdict(s) for s in stream_objects]
         
     elif source and "kevinsport" in source.lower():
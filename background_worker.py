@@ -1,37 +1,40 @@
-import time
-import json
-import os
+from collections import Counter
 from scrapers.service import ScraperService
 from scrapers.registry import provider_registry
+from scrapers.scheduler import ProviderScheduler
+from scrapers.store import SegmentStore
 from dataclasses import asdict
 
 CACHE_FILE = "cache/events.json"
+SEGMENTS_DIR = "cache/segments"
 service = ScraperService(provider_registry)
 
-def run_scraping():
-    """Ejecuta scraping de todos los providers y actualiza la caché."""
-    print("Scraping iniciado...")
-    try:
-        events = service.build_events()
-        data = [asdict(e) for e in events]
-        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
-        with open(CACHE_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        print(f"Scraping completado ({len(events)} eventos)")
-        
-        # Log por provider
-        from collections import Counter
-        providers = Counter(e.provider for e in events)
-        for prov, count in providers.items():
-            print(f"  - {prov}: {count} eventos")
-            
-    except Exception as e:
-        print(f"Error scraping: {e}")
-        import traceback
-        traceback.print_exc()
+# Un segmento por provider; events.json se reconstruye solo cuando alguno cambia
+segments = SegmentStore(SEGMENTS_DIR, CACHE_FILE)
+
+
+def on_provider_result(provider, events):
+    if events is None:
+        # Fallo: se mantiene el último segmento bueno del provider
+        segments.mark_failed(provider.name)
+        return
+
+    if not segments.update(provider.name, [asdict(e) for e in events]):
+        return
+
+    merged = segments.merged()
+    print(f"Snapshot publicado tras actualizar {provider.name} ({len(merged)} eventos)")
+    providers = Counter(e["provider"] for e in merged)
+    for prov, count in providers.items():
+        print(f"  - {prov}: {count} eventos")
+
 
 if __name__ == "__main__":
     print("Worker ejecutándose...")
-    while True:
-        run_scraping()
-        time.sleep(120)  # 2 minutos
\ No newline at end of file
+    # Cada provider se refresca por separado con su propio intervalo
+    scheduler = ProviderScheduler(
+        provider_registry,
+        fetch=service.fetch_provider,
+        on_result=on_provider_result,
+    )
+    scheduler.run_forever()
@@ -0,0 +1,229 @@
+"""
+Páginas de prueba para los benchmarks, indexadas por url.
+
+Si existe benchmarks/recorded/<host>/... con respuestas grabadas de los
+sitios reales se usan esas; si no, se generan páginas sintéticas y
+deterministas que imitan el marcado de cada provider (mismas clases, tablas
+e iframes, con el "ruido" típico de menús, scripts y otros deportes).
+"""
+
+import hashlib
+import json
+import os
+import random
+from typing import Dict, List, Tuple
+
+RECORDED_DIR = os.path.join(os.path.dirname(__file__), "recorded")
+
+# url -> (content_type, body)
+Site = Dict[str, Tuple[str, bytes]]
+
+HTML = "text/html; charset=utf-8"
+JSON = "application/json"
+
+TEAMS = [
+    "Real Madrid", "Barcelona", "Atlético", "Sevilla", "Valencia", "Villarreal",
+    "Flamengo-RJ", "Fluminense", "Palmeiras", "Boca Juniors", "River Plate",
+    "Manchester City", "Arsenal", "Liverpool", "Chelsea", "Bayern München",
+    "Borussia Dortmund", "Juventus", "Inter", "Milan", "Napoli", "PSG",
+    "Olympique Lyon", "Benfica", "Porto", "Ajax", "PSV", "Galatasaray",
+]
+LEAGUES = [
+    "Spain. LaLiga", "Brazil. Serie A", "England. Premier League",
+    "Germany. Bundesliga", "Italy. Serie A", "France. Ligue 1",
+    "Portugal. Primeira Liga", "UEFA Champions League", "Copa Libertadores",
+]
+
+NOISE_BLOCK = (
+    '<div class="menu"><ul>' + "".join(
+        f'<li><a href="/enx/section/{i}/"><img src="/img/{i}.gif" width="16"> Sección {i}</a></li>'
+        for i in range(40)
+    ) + "</ul></div>"
+    '<script>var cfg={"lang":"es","ads":[1,2,3],"tz":0};function f(x){return x*2}</script>'
+)
+
+
+def _page(body: str, title: str = "") -> str:
+    return (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'>"
+        f"<title>{title}</title><link rel='stylesheet' href='/s.css'>"
+        "<script src='/jquery.js'></script></head><body>"
+        f"{NOISE_BLOCK}{body}{NOISE_BLOCK}</body></html>"
+    )
+
+
+def _match(rng: random.Random) -> Tuple[str, str, str, str]:
+    home, away = rng.sample(TEAMS, 2)
+    return home, away, rng.choice(LEAGUES), f"{rng.randint(0, 23):02d}:{rng.choice(['00', '15', '30', '45'])}"
+
+
+# ==============================
+#   Sitios sintéticos
+# ==============================
+def _kakarotfoot(rng: random.Random, site: Site, n: int = 120):
+    feed = []
+    for i in range(n):
+        home, away, league, _ = _match(rng)
+        feed.append({
+            "id": str(1000 + i),
+            "home": home,
+            "away": away,
+            "league": league,
+            "url": f"match/{1000 + i}",
+            "time": 1_700_000_000_000 + i * 900_000,
+            "streams": [
+                {"ch": str(rng.randint(1, 80)), "name": f"Canal {j + 1}", "lang": rng.choice(["es", "en", "pt"])}
+                for j in range(rng.randint(1, 4))
+            ],
+        })
+    site["https://kakarotfoot.ru/json.php"] = (JSON, json.dumps(feed).encode("utf-8"))
+
+
+def _livetv(rng: random.Random, site: Site, n: int = 600, with_pages: int = 30):
+    rows = []
+    for i in range(n):
+        home, away, league, hour = _match(rng)
+        event_path = f"/enx/eventinfo/{300000 + i}_{home.lower().replace(' ', '_')}/"
+        rows.append(
+            "<tr><td width='34'><img src='/img/sport.gif'></td><td>"
+            f"<a class='live' href='/enx/live/{i}/'>live</a> "
+            f"<a class='bottomgray' href='{event_path}'><b>{home}</b> – {away}</a><br>"
+            f"<span class='evdesc'>{hour} ({league})</span>"
+            "</td><td><img src='/img/hd.gif'></td></tr>"
+        )
+        # Otros deportes en la misma página (no tienen eventinfo)
+        rows.append(
+            f"<tr><td><a class='bottomgray' href='/enx/sport/{i}/'>Basket {i}</a>"
+            f"<span class='evdesc'>{hour} (NBA)</span></td></tr>"
+        )
+
+        if i < with_pages:
+            url = f"https://livetv.sx{event_path}"
+            links = "".join(
+                f"<tr><td><a href='/webplayer.php?t=ifr&c={i}{j}&lang=es'>Enlace {j + 1}</a></td></tr>"
+                for j in range(4)
+            )
+            script = f"<script>var p='https://livetv.sx/webplayer.php?t=alieztv&c={i}99';</script>"
+            site[url] = (HTML, _page(f"<table>{links}</table>{script}", f"{home} – {away}").encode("utf-8"))
+            for j in list(range(4)) + [99]:
+                wp = f"https://livetv.sx/webplayer.php?t={'ifr' if j != 99 else 'alieztv'}&c={i}{j}" + ("&lang=es" if j != 99 else "")
+                site[wp] = (HTML, _page(f"<iframe src='//cdn{j}.player.tv/embed/{i}{j}' allowfullscreen></iframe>").encode("utf-8"))
+
+    body = "<table class='main'>" + "".join(rows) + "</table>"
+    site["https://livetv.sx/enx/allupcomingsports/1/"] = (HTML, _page(body, "LiveTV").encode("utf-8"))
+
+
+def _kevinsport(rng: random.Random, site: Site, n: int = 80):
+    rows = []
+    for i in range(n):
+        if i % 8 == 0:
+            rows.append(f"<tr class='table-info'><td colspan='3'>{rng.choice(LEAGUES)}</td></tr>")
+        home, away, _, hour = _match(rng)
+        event_path = f"/live/football/{i}-{home.lower().replace(' ', '-')}"
+        rows.append(
+            "<tr class='table-dark'>"
+            f"<td class='matchtime'>{hour}</td>"
+            f"<td class='pnltblttl'>{home} Vs {away}</td>"
+            f"<td><a href='{event_path}' class='btn'>Watch</a></td></tr>"
+        )
+
+        buttons = "".join(f"<a href='{event_path}/stream-{j}'>Stream {j}</a>" for j in range(2, 5))
+        site[f"https://kevinsport.pro{event_path}"] = (HTML, _page(
+            f"<div class='player'><iframe src='//embed.kevin.tv/{i}/1'></iframe></div>{buttons}"
+        ).encode("utf-8"))
+        for j in range(2, 5):
+            site[f"https://kevinsport.pro{event_path}/stream-{j}"] = (HTML, _page(
+                f"<iframe src='//embed.kevin.tv/{i}/{j}'></iframe>"
+            ).encode("utf-8"))
+
+    body = "<table class='table table-hover'>" + "".join(rows) + "</table>"
+    site["https://kevinsport.pro/live/football/"] = (HTML, _page(body, "KevinSport").encode("utf-8"))
+
+
+def _tiroalpalo(rng: random.Random, site: Site, n: int = 60):
+    links = []
+    for i in range(n):
+        home, away, league, hour = _match(rng)
+        slug = f"{home}-{away}".lower().replace(" ", "-")
+        links.append(f"<li><a href='/evento/{slug}-{i}'>{home} - {away}</a> <small>{league}</small></li>")
+
+        streams = "".join(
+            f"<a href='https://player{j}.tiro.tv/{i}'>Link {j + 1}</a>" for j in range(3)
+        )
+        site[f"https://tiroalpalome.com/evento/{slug}-{i}"] = (HTML, _page(
+            f"<h1>{hour} | {home} vs {away}</h1><p>{league}</p>"
+            f"<iframe src='https://stream.tiro.tv/embed/{i}'></iframe><div>{streams}</div>",
+            f"{home} vs {away}",
+        ).encode("utf-8"))
+
+    body = "<ul class='agenda'>" + "".join(links) + "</ul>"
+    site["https://tiroalpalome.com/directo"] = (HTML, _page(body, "Directo").encode("utf-8"))
+
+
+def synthetic_site(seed: int = 42) -> Site:
+    rng = random.Random(seed)
+    site: Site = {}
+    _kakarotfoot(rng, site)
+    _livetv(rng, site)
+    _kevinsport(rng, site)
+    _tiroalpalo(rng, site)
+    return site
+
+
+# ==============================
+#   Respuestas grabadas
+# ==============================
+def recorded_site() -> Site:
+    """Lee benchmarks/recorded/index.json (url -> fichero, content_type)."""
+    index_path = os.path.join(RECORDED_DIR, "index.json")
+    if not os.path.exists(index_path):
+        return {}
+
+    with open(index_path, "r", encoding="utf-8") as f:
+        index = json.load(f)
+
+    site: Site = {}
+    for url, entry in index.items():
+        with open(os.path.join(RECORDED_DIR, entry["file"]), "rb") as f:
+            site[url] = (entry.get("content_type", HTML), f.read())
+    return site
+
+
+def save_recorded(site: Site, directory: str = RECORDED_DIR):
+    """Escribe un Site en benchmarks/recorded/ (un fichero por url + index.json)."""
+    index = {}
+    for url, (content_type, body) in sorted(site.items()):
+        host = url.split("/")[2]
+        ext = "json" if "json" in content_type else "html"
+        name = f"{host}/{hashlib.sha1(url.encode('utf-8')).hexdigest()[:16]}.{ext}"
+        os.makedirs(os.path.join(directory, host), exist_ok=True)
+        with open(os.path.join(directory, name), "wb") as f:
+            f.write(body)
+        index[url] = {"file": name, "content_type": content_type}
+
+    with open(os.path.join(directory, "index.json"), "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+
+
+def load_site() -> Site:
+    """Respuestas grabadas si las hay; si no, el sitio sintético."""
+    return recorded_site() or synthetic_site()
+
+
+PROVIDER_HOSTS = {
+    "Kakarotfoot": "kakarotfoot.ru",
+    "LiveTV": "livetv.sx",
+    "KevinSport": "kevinsport.pro",
+    "Tiroalpalo": "tiroalpalome.com",
+}
+
+
+def html_pages(site: Site, provider: str) -> List[Tuple[str, str]]:
+    """Páginas HTML (url, html) de un provider, la mayor primero."""
+    host = PROVIDER_HOSTS[provider]
+    pages = [
+        (url, body.decode("utf-8", errors="replace"))
+        for url, (content_type, body) in site.items()
+        if host in url and content_type.startswith("text/html")
+    ]
+    return sorted(pages, key=lambda p: -len(p[1]))
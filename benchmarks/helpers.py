@@ -0,0 +1,150 @@
+"""
+Micro-benchmark de los helpers de texto / urls de los providers.
+
+Uso:
+    python -m benchmarks.helpers [--repeat 5] [--n 20000]
+
+Compara el coste por evento de las versiones anteriores (regex sin
+precompilar y lógica repetida en cada provider) con scrapers/utils.py,
+sobre entradas parecidas a las de las páginas reales.
+"""
+
+import argparse
+import random
+import re
+import time
+
+from scrapers.utils import (
+    VS_RE,
+    absolute_url,
+    split_teams,
+    split_time_prefix,
+    text_in_parens,
+)
+
+from .fixtures import LEAGUES, TEAMS
+
+
+# ==============================
+#   Versiones anteriores
+# ==============================
+def legacy_split_teams(title):
+    for sep in [" – ", " - ", " vs ", " Vs ", " v "]:
+        if sep in title:
+            h, a = title.split(sep, 1)
+            return h.strip(), a.strip()
+    return title.strip(), ""
+
+
+def legacy_absolute_from(base, url):
+    if url.startswith("http://") or url.startswith("https://"):
+        return url
+    if url.startswith("//"):
+        return "https:" + url
+
+    m = re.match(r"(https?://[^/]+)", base)
+    root = m.group(1) if m else "https://livetv.sx"
+
+    if url.startswith("/"):
+        return root + url
+    return root + "/" + url.lstrip("/")
+
+
+def legacy_league(raw_desc):
+    league = ""
+    m = re.search(r"\((.*?)\)", raw_desc)
+    if m:
+        league = m.group(1).strip()
+    return league
+
+
+def legacy_tiro_title(title):
+    home = away = ""
+    m = re.match(r"(\d{1,2}:\d{2})\s*[|\-]?(.*)", title)
+    if m:
+        match_time = m.group(1)
+        title_no_time = m.group(2).strip()
+    else:
+        match_time = None
+        title_no_time = title
+
+    if " vs " in title_no_time.lower():
+        parts = re.split(r"\s+vs\s+", title_no_time, flags=re.IGNORECASE)
+        if len(parts) == 2:
+            home, away = parts[0].strip(), parts[1].strip()
+    elif "-" in title_no_time:
+        parts = title_no_time.split("-", 1)
+        home, away = parts[0].strip(), parts[1].strip()
+    else:
+        home = title_no_time
+    return match_time, home, away
+
+
+# ==============================
+#   Versiones actuales
+# ==============================
+def current_tiro_title(title):
+    match_time, title_no_time = split_time_prefix(title)
+    home, away = split_teams(VS_RE.sub(" vs ", title_no_time), (" vs ", "-"))
+    return match_time, home, away
+
+
+def make_inputs(n, seed=7):
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        home, away = rng.sample(TEAMS, 2)
+        hour = f"{rng.randint(0, 23):02d}:{rng.choice(['00', '30'])}"
+        rows.append({
+            "title": f"{home} – {away}",
+            "desc": f"{hour} ({rng.choice(LEAGUES)})",
+            "tiro": f"{hour} | {home} vs {away}",
+            "base": f"https://livetv.sx/enx/eventinfo/{300000 + i}_x/",
+            "href": rng.choice([
+                f"/webplayer.php?t=ifr&c={i}",
+                f"//cdn{i % 5}.player.tv/embed/{i}",
+                f"https://cdn.player.tv/embed/{i}",
+            ]),
+        })
+    return rows
+
+
+CASES = [
+    ("split_teams", lambda r: legacy_split_teams(r["title"]), lambda r: split_teams(r["title"])),
+    ("absolute_url", lambda r: legacy_absolute_from(r["base"], r["href"]), lambda r: absolute_url(r["href"], r["base"])),
+    ("liga (evdesc)", lambda r: legacy_league(r["desc"]), lambda r: text_in_parens(r["desc"])),
+    ("título Tiroalpalo", lambda r: legacy_tiro_title(r["tiro"]), lambda r: current_tiro_title(r["tiro"])),
+]
+
+
+def measure(fn, rows, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for row in rows:
+            fn(row)
+        best = min(best, time.perf_counter() - start)
+    return best / len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--n", type=int, default=20000)
+    args = parser.parse_args()
+
+    rows = make_inputs(args.n)
+
+    print(f"{'helper':<20} {'antes ns/ev':>12} {'ahora ns/ev':>12} {'↓ tiempo':>9}")
+    for name, before, after in CASES:
+        # Mismo resultado antes y después
+        assert all(before(r) == after(r) for r in rows[:500]), name
+
+        t_before = measure(before, rows, args.repeat)
+        t_after = measure(after, rows, args.repeat)
+        print(f"{name:<20} {t_before * 1e9:>12.0f} {t_after * 1e9:>12.0f} "
+              f"{(1 - t_after / t_before) * 100:>8.0f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark de backends de parseo HTML por provider.
+
+Uso:
+    python -m benchmarks.parsers [--repeat 5]
+
+Para cada provider parsea sus páginas de prueba (grabadas o sintéticas,
+ver benchmarks/fixtures.py) con cada backend disponible y muestra el tiempo
+total de parseo y el pico de memoria de la página más grande.
+
+Después compara, en la página de agenda de cada provider, el árbol completo
+con el parseo parcial (SoupStrainer) que usan los providers.
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from scrapers.parsing import FALLBACK_BACKEND, make_soup
+from scrapers.providers import kevinsport, livetv, tiroalpalo
+
+from .fixtures import PROVIDER_HOSTS, html_pages, load_site
+
+# Página de agenda (url) y strainer con el que la parsea cada provider
+SCHEDULE_PAGES = {
+    "LiveTV": (livetv.LiveTVProvider.LIST_URL, livetv.SCHEDULE_STRAINER),
+    "KevinSport": (kevinsport.KevinsportProvider.URL, kevinsport.SCHEDULE_STRAINER),
+    "Tiroalpalo": (tiroalpalo.TiroalpaloProvider.LIST_URL, tiroalpalo.LIST_STRAINER),
+}
+
+
+def available_backends():
+    backends = [FALLBACK_BACKEND]
+    try:
+        import lxml  # noqa: F401
+        backends.append("lxml")
+    except ImportError:
+        pass
+    return backends
+
+
+def measure(pages, backend, repeat, parse_only=None):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _, html in pages:
+            make_soup(html, parse_only=parse_only, backend=backend)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    make_soup(pages[0][1], parse_only=parse_only, backend=backend)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best, peak
+
+
+def _delta(value, baseline):
+    return f"{(1 - value / baseline) * 100:.0f}%"
+
+
+def compare_backends(site, backends, repeat):
+    print(f"{'provider':<12} {'backend':<12} {'páginas':>7} {'KB':>7} {'tiempo ms':>10} {'pico MB':>8} {'↓ tiempo':>9} {'↓ memoria':>10}")
+    for provider in PROVIDER_HOSTS:
+        pages = html_pages(site, provider)
+        if not pages:
+            continue
+        size_kb = sum(len(html) for _, html in pages) / 1024
+
+        baseline = None
+        for backend in backends:
+            elapsed, peak = measure(pages, backend, repeat)
+            if baseline is None:
+                baseline = (elapsed, peak)
+                delta_t = delta_m = "-"
+            else:
+                delta_t = _delta(elapsed, baseline[0])
+                delta_m = _delta(peak, baseline[1])
+            print(f"{provider:<12} {backend:<12} {len(pages):>7} {size_kb:>7.0f} "
+                  f"{elapsed * 1000:>10.1f} {peak / 2**20:>8.2f} {delta_t:>9} {delta_m:>10}")
+
+
+def compare_strainers(site, backends, repeat):
+    print(f"{'provider':<12} {'backend':<12} {'KB':>7} {'completo ms':>12} {'parcial ms':>11} "
+          f"{'completo MB':>12} {'parcial MB':>11} {'↓ tiempo':>9} {'↓ memoria':>10}")
+    for provider, (url, strainer) in SCHEDULE_PAGES.items():
+        if url not in site:
+            continue
+        pages = [(url, site[url][1].decode("utf-8", errors="replace"))]
+        size_kb = len(pages[0][1]) / 1024
+
+        for backend in backends:
+            full_t, full_m = measure(pages, backend, repeat)
+            part_t, part_m = measure(pages, backend, repeat, parse_only=strainer)
+            print(f"{provider:<12} {backend:<12} {size_kb:>7.0f} {full_t * 1000:>12.1f} {part_t * 1000:>11.1f} "
+                  f"{full_m / 2**20:>12.2f} {part_m / 2**20:>11.2f} "
+                  f"{_delta(part_t, full_t):>9} {_delta(part_m, full_m):>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    site = load_site()
+    backends = available_backends()
+
+    compare_backends(site, backends, args.repeat)
+    print()
+    compare_strainers(site, backends, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
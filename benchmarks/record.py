@@ -0,0 +1,52 @@
+"""
+Graba las respuestas reales de los providers en benchmarks/recorded/.
+
+Uso:
+    python -m benchmarks.record [--livetv-events 20]
+
+Ejecuta cada provider una vez contra los sitios reales con un
+RecordingClient y guarda todas las respuestas (agenda, páginas de evento,
+webplayers...). A partir de entonces benchmarks.run y benchmarks.parsers
+usan esas grabaciones en lugar del sitio sintético.
+"""
+
+import argparse
+
+from .fixtures import RECORDED_DIR, save_recorded
+from .replay import RecordingClient
+from .run import PROVIDER_CLASSES
+
+RECORD_TIMEOUT = 120
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--livetv-events", type=int, default=20,
+                        help="eventos de LiveTV cuyos streams (lazy) también se graban")
+    args = parser.parse_args()
+
+    client = RecordingClient()
+    try:
+        for name, cls in PROVIDER_CLASSES.items():
+            provider = cls()
+            provider.http = client
+            try:
+                events = client.run(provider.fetch_events_async(), RECORD_TIMEOUT) or []
+            except Exception as e:
+                print(f"[record] {name}: error {e}")
+                continue
+            print(f"[record] {name}: {len(events)} eventos")
+
+            # LiveTV carga los streams bajo demanda: grabar también algunos
+            if name == "LiveTV":
+                for event in events[:args.livetv_events]:
+                    provider.load_streams(event.url)
+    finally:
+        client.close()
+
+    save_recorded(client.site)
+    print(f"[record] {len(client.site)} respuestas guardadas en {RECORDED_DIR}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Clientes HTTP para los benchmarks, con la misma interfaz que AsyncHttpClient.
+
+• ReplayClient: sirve las respuestas de un Site (ver benchmarks/fixtures.py)
+  sin tocar la red. Simula una latencia fija por petición y respeta el
+  límite de conexiones por host del cliente real, así que los modos de
+  concurrencia se pueden comparar offline. Cuenta las peticiones hechas.
+• RecordingClient: descarga de verdad (cliente real) y guarda cada
+  respuesta para poder grabarlas en benchmarks/recorded/.
+
+Se asignan a un provider con `provider.http = ReplayClient(site)`.
+"""
+
+import asyncio
+from collections import defaultdict
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from scrapers.http import DEFAULT_TIMEOUT, AsyncHttpClient, FetchResult
+
+from .fixtures import HTML, Site
+
+
+class ReplayMiss(Exception):
+    """La url pedida no está entre las respuestas grabadas."""
+
+
+class ReplayClient(AsyncHttpClient):
+    def __init__(self, site: Site, latency: float = 0.0, **kwargs):
+        super().__init__(**kwargs)
+        self.site = site
+        self.latency = latency
+
+        self.requests = 0
+        self.misses = 0
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._per_host_requests: Dict[str, int] = defaultdict(int)
+
+    async def _create_session(self):
+        # Sin sesión aiohttp: nada sale a la red
+        pass
+
+    def _slot(self, host: str) -> asyncio.Semaphore:
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(self.max_per_host)
+        return slot
+
+    async def fetch(
+        self,
+        url: str,
+        headers: Optional[dict] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        verify: bool = True,
+        conditional: bool = False,
+        force: bool = False,
+    ) -> Optional[FetchResult]:
+        host = urlsplit(url).netloc
+        self.requests += 1
+        self._per_host_requests[host] += 1
+
+        # Como el pool real: como mucho max_per_host peticiones a la vez por host
+        async with self._slot(host):
+            if self.latency:
+                await asyncio.sleep(self.latency)
+
+        entry = self.site.get(url)
+        if entry is None:
+            self.misses += 1
+            raise ReplayMiss(url)
+
+        content_type, body = entry
+        resp_headers = {"Content-Type": content_type}
+        result = FetchResult(url, 200, resp_headers, body, "utf-8")
+
+        if conditional:
+            changed = self.conditional.update(url, 200, resp_headers, body)
+            if not changed and not force:
+                return None
+        return result
+
+    def requests_for(self, host: str) -> int:
+        return self._per_host_requests.get(host, 0)
+
+
+class RecordingClient(AsyncHttpClient):
+    """Cliente real que además guarda cada respuesta descargada."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.site: Site = {}
+
+    async def fetch(self, url: str, *args, **kwargs) -> Optional[FetchResult]:
+        # Siempre el cuerpo completo: una respuesta 304 no sirve para grabar
+        kwargs["force"] = True
+        result = await super().fetch(url, *args, **kwargs)
+        if result is not None:
+            content_type = result.headers.get("Content-Type", HTML)
+            self.site[url] = (content_type, result.content)
+        return result
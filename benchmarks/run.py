@@ -0,0 +1,164 @@
+"""
+Benchmark offline de los providers y de ScraperService.build_events.
+
+Uso:
+    python -m benchmarks.run [--repeat 3] [--latency 30] [--provider LiveTV]
+
+Cada provider descarga sus páginas de un ReplayClient (respuestas grabadas o
+sintéticas, ver benchmarks/fixtures.py), con una latencia simulada por
+petición y el mismo límite por host que el cliente real. Sin red, el tiempo
+de CPU es prácticamente el de parseo y construcción de eventos.
+
+Por provider se muestra: eventos, peticiones (y urls que faltan en las
+grabaciones), tiempo total, CPU, tiempo de una segunda vuelta con las mismas
+respuestas (peticiones condicionales / refresco incremental) y pico de
+memoria. Después, build_events de extremo a extremo en modo concurrente y
+secuencial.
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from scrapers.providers.kakarotfoot import KakarotfootProvider
+from scrapers.providers.kevinsport import KevinsportProvider
+from scrapers.providers.livetv import LiveTVProvider
+from scrapers.providers.tiroalpalo import TiroalpaloProvider
+from scrapers.service import ScraperService
+
+from .fixtures import PROVIDER_HOSTS, load_site
+from .replay import ReplayClient
+
+PROVIDER_CLASSES = {
+    "Kakarotfoot": KakarotfootProvider,
+    "LiveTV": LiveTVProvider,
+    "KevinSport": KevinsportProvider,
+    "Tiroalpalo": TiroalpaloProvider,
+}
+
+
+def _timed(fn):
+    wall, cpu = time.perf_counter(), time.process_time()
+    result = fn()
+    return result, time.perf_counter() - wall, time.process_time() - cpu
+
+
+def _peak(fn) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def _fresh_provider(site, name, latency=0.0):
+    # Provider y cliente nuevos: sin validadores ni resultados previos
+    client = ReplayClient(site, latency=latency)
+    provider = PROVIDER_CLASSES[name]()
+    provider.http = client
+    return client, provider
+
+
+def _fresh_service(site, names, concurrent, latency=0.0):
+    client = ReplayClient(site, latency=latency)
+    providers = [PROVIDER_CLASSES[name]() for name in names]
+    for p in providers:
+        p.http = client
+    service = ScraperService(providers, concurrent=concurrent)
+
+    if concurrent:
+        # Lo mismo que build_events(), pero en el loop del cliente de replay
+        def build():
+            return client.run(service.build_events_async())
+    else:
+        build = service.build_events
+    return client, build
+
+
+def bench_provider(site, name, latency, repeat):
+    best = None
+    for _ in range(repeat):
+        client, provider = _fresh_provider(site, name, latency)
+        try:
+            events, wall, cpu = _timed(lambda: client.run(provider.fetch_events_async()))
+            requests, misses = client.requests, client.misses
+            # Segunda vuelta con el mismo provider: mismas respuestas
+            _, warm, _ = _timed(lambda: client.run(provider.fetch_events_async()))
+        finally:
+            client.close()
+
+        run = {
+            "events": len(events or []),
+            "requests": requests,
+            "misses": misses,
+            "wall": wall,
+            "cpu": cpu,
+            "warm": warm,
+        }
+        if best is None or run["wall"] < best["wall"]:
+            best = run
+
+    client, provider = _fresh_provider(site, name)
+    try:
+        best["peak"] = _peak(lambda: client.run(provider.fetch_events_async()))
+    finally:
+        client.close()
+    return best
+
+
+def bench_service(site, names, concurrent, latency, repeat):
+    best = None
+    for _ in range(repeat):
+        client, build = _fresh_service(site, names, concurrent, latency)
+        try:
+            events, wall, cpu = _timed(build)
+        finally:
+            client.close()
+
+        run = {"events": len(events), "requests": client.requests, "wall": wall, "cpu": cpu}
+        if best is None or run["wall"] < best["wall"]:
+            best = run
+
+    client, build = _fresh_service(site, names, concurrent)
+    try:
+        best["peak"] = _peak(build)
+    finally:
+        client.close()
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=30, help="latencia simulada por petición (ms)")
+    parser.add_argument("--provider", action="append", choices=sorted(PROVIDER_CLASSES),
+                        help="limitar a uno o varios providers")
+    args = parser.parse_args()
+
+    site = load_site()
+    latency = args.latency / 1000
+    names = [
+        name for name in (args.provider or PROVIDER_CLASSES)
+        if any(PROVIDER_HOSTS[name] in url for url in site)
+    ]
+
+    print(f"latencia simulada: {args.latency:.0f} ms/petición, {len(site)} respuestas\n")
+    print(f"{'provider':<12} {'eventos':>7} {'peticiones':>10} {'faltan':>6} {'total ms':>9} "
+          f"{'CPU ms':>8} {'2ª vuelta ms':>12} {'pico MB':>8}")
+    for name in names:
+        r = bench_provider(site, name, latency, args.repeat)
+        print(f"{name:<12} {r['events']:>7} {r['requests']:>10} {r['misses']:>6} {r['wall'] * 1000:>9.1f} "
+              f"{r['cpu'] * 1000:>8.1f} {r['warm'] * 1000:>12.1f} {r['peak'] / 2**20:>8.2f}")
+
+    print()
+    print(f"{'build_events':<12} {'eventos':>7} {'peticiones':>10} {'total ms':>9} {'CPU ms':>8} {'pico MB':>8}")
+    for label, concurrent in (("concurrente", True), ("secuencial", False)):
+        r = bench_service(site, names, concurrent, latency, args.repeat)
+        print(f"{label:<12} {r['events']:>7} {r['requests']:>10} {r['wall'] * 1000:>9.1f} "
+              f"{r['cpu'] * 1000:>8.1f} {r['peak'] / 2**20:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
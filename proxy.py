@@ -0,0 +1,212 @@
+"""
+Proxy de streams para esquivar bloqueos de referer.
+
+• Usa una sesión HTTP compartida (keep-alive + pool de conexiones).
+• Reenvía el cuerpo al cliente por trozos, sin cargarlo entero en memoria.
+• Propaga Range y las cabeceras relevantes para que funcionen los saltos
+  en vídeo y el cliente conozca el tamaño del recurso.
+• Modo HLS: las playlists .m3u8 se reescriben para que variantes, segmentos
+  y claves vuelvan a pasar por /proxy, y los segmentos .ts/.m4s se guardan
+  en una LRU en memoria para que todos los espectadores de un mismo partido
+  compartan una única descarga por segmento.
+"""
+
+import re
+from urllib.parse import quote, urljoin, urlsplit
+
+import requests
+from flask import Response
+from requests.adapters import HTTPAdapter
+
+from scrapers.cache import TTLCache
+
+CHUNK_SIZE = 64 * 1024
+
+PROXY_PATH = "/proxy?u="
+
+PLAYLIST_EXTENSIONS = (".m3u8",)
+SEGMENT_EXTENSIONS = (".ts", ".m4s")
+PLAYLIST_CONTENT_TYPES = (
+    "application/vnd.apple.mpegurl",
+    "application/x-mpegurl",
+    "audio/mpegurl",
+    "audio/x-mpegurl",
+)
+PLAYLIST_CONTENT_TYPE = "application/vnd.apple.mpegurl"
+
+# Las playlists en directo cambian cada pocos segundos; los segmentos no cambian
+PLAYLIST_TTL = 1
+SEGMENT_TTL = 60
+# ~48 segmentos de 1-2 MB: memoria acotada a unas decenas de MB
+SEGMENT_CACHE_SIZE = 48
+
+_playlist_cache = TTLCache(ttl=PLAYLIST_TTL, maxsize=128)
+_segment_cache = TTLCache(ttl=SEGMENT_TTL, maxsize=SEGMENT_CACHE_SIZE)
+
+# URI="..." dentro de etiquetas como EXT-X-KEY, EXT-X-MEDIA o EXT-X-MAP
+URI_ATTR_RE = re.compile(r'URI="([^"]+)"')
+
+UPSTREAM_HEADERS = {
+    "User-Agent": "Mozilla/5.0",
+    "Referer": "https://kevinsport.digital/"
+}
+
+# Cabeceras del cliente que se reenvían al origen
+FORWARD_REQUEST_HEADERS = ("Range", "If-Range", "Accept", "Accept-Encoding")
+
+# Cabeceras del origen que se devuelven al cliente
+PASSTHROUGH_RESPONSE_HEADERS = (
+    "Content-Type",
+    "Content-Length",
+    "Content-Encoding",
+    "Content-Range",
+    "Accept-Ranges",
+    "Cache-Control",
+    "ETag",
+    "Last-Modified",
+    "Expires",
+)
+
+session = requests.Session()
+session.headers.update(UPSTREAM_HEADERS)
+_adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50)
+session.mount("https://", _adapter)
+session.mount("http://", _adapter)
+
+
+def _upstream_headers(client_headers) -> dict:
+    headers = {}
+    for name in FORWARD_REQUEST_HEADERS:
+        value = client_headers.get(name)
+        if value:
+            headers[name] = value
+    # Sin Accept-Encoding del cliente pedimos el cuerpo sin comprimir
+    headers.setdefault("Accept-Encoding", "identity")
+    return headers
+
+
+def stream_response(target: str, client_headers) -> Response:
+    """Abre `target` y devuelve una Response de Flask que lo reenvía por trozos."""
+    return _streaming_response(_open_upstream(target, client_headers))
+
+
+def _open_upstream(target: str, client_headers) -> requests.Response:
+    return session.get(
+        target,
+        headers=_upstream_headers(client_headers),
+        stream=True,
+        timeout=(5, 15),
+    )
+
+
+def _streaming_response(r: requests.Response) -> Response:
+    def generate():
+        try:
+            # decode_content=False: los bytes van tal cual (Content-Length/Encoding intactos)
+            for chunk in r.raw.stream(CHUNK_SIZE, decode_content=False):
+                yield chunk
+        finally:
+            r.close()
+
+    headers = {
+        name: r.headers[name]
+        for name in PASSTHROUGH_RESPONSE_HEADERS
+        if name in r.headers
+    }
+
+    return Response(
+        generate(),
+        status=r.status_code,
+        headers=headers,
+        direct_passthrough=True,
+    )
+
+
+# ==============================
+#   HLS
+# ==============================
+def proxy_response(target: str, client_headers) -> Response:
+    """Punto de entrada de /proxy: elige modo HLS o streaming genérico."""
+    path = urlsplit(target).path.lower()
+
+    if path.endswith(PLAYLIST_EXTENSIONS):
+        playlist = _playlist_cache.get_or_load(target, lambda: _fetch_playlist(target))
+        if playlist[0] != 200:
+            # Un error del origen (5xx/403...) no se sirve a todos durante el TTL
+            _playlist_cache.pop(target)
+        return _playlist_response(playlist)
+
+    # Con Range el cliente quiere un trozo concreto: no pasa por la caché
+    if path.endswith(SEGMENT_EXTENSIONS) and "Range" not in client_headers:
+        return _segment_response(target)
+
+    r = _open_upstream(target, client_headers)
+    content_type = (r.headers.get("Content-Type") or "").split(";")[0].strip().lower()
+    if content_type in PLAYLIST_CONTENT_TYPES and r.status_code == 200:
+        # Playlist sin extensión .m3u8: se detecta por Content-Type
+        try:
+            return _playlist_response((200, rewrite_playlist(r.text, r.url)))
+        finally:
+            r.close()
+
+    return _streaming_response(r)
+
+
+def proxied_url(url: str) -> str:
+    return PROXY_PATH + quote(url, safe="")
+
+
+def rewrite_playlist(text: str, base_url: str) -> str:
+    """Hace que todas las URIs de una playlist HLS apunten a /proxy."""
+    out = []
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            out.append(line)
+        elif stripped.startswith("#"):
+            out.append(URI_ATTR_RE.sub(
+                lambda m: 'URI="%s"' % proxied_url(urljoin(base_url, m.group(1))),
+                line,
+            ))
+        else:
+            # Línea de URI: variante o segmento
+            out.append(proxied_url(urljoin(base_url, stripped)))
+    return "\n".join(out) + "\n"
+
+
+def _fetch_playlist(target: str) -> tuple:
+    r = session.get(target, timeout=(5, 10))
+    if r.status_code != 200:
+        return r.status_code, r.text
+    # r.url es la url final tras redirecciones: base correcta para las relativas
+    return r.status_code, rewrite_playlist(r.text, r.url)
+
+
+def _playlist_response(playlist: tuple) -> Response:
+    status, body = playlist
+    return Response(
+        body,
+        status=status,
+        content_type=PLAYLIST_CONTENT_TYPE,
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+def _fetch_segment(target: str) -> tuple:
+    r = session.get(target, timeout=(5, 15))
+    headers = {
+        name: r.headers[name]
+        for name in ("Content-Type", "Cache-Control", "ETag", "Last-Modified")
+        if name in r.headers
+    }
+    return r.status_code, headers, r.content
+
+
+def _segment_response(target: str) -> Response:
+    segment = _segment_cache.get_or_load(target, lambda: _fetch_segment(target))
+    status, headers, body = segment
+    if status != 200:
+        # Los errores no se cachean
+        _segment_cache.pop(target)
+
+    return Response(body, status=status, headers=headers)
@@ -0,0 +1,167 @@
+"""
+Respuestas ya generadas por versión del snapshot.
+
+La página principal, /api/events (y cualquier respuesta que dependa solo
+del snapshot) cambian únicamente cuando el worker publica un snapshot nuevo.
+Aquí se generan una vez por versión (y consulta) y se guardan en memoria
+junto con sus variantes comprimidas (gzip y, si está instalado el paquete
+`brotli`, br):
+
+• Cada petición elige la variante según Accept-Encoding, sin volver a
+  renderizar. Cada variante se comprime la primera vez que alguien la pide
+  (una búsqueda que solo se hace una vez no paga br y gzip a la vez).
+• ETag fuerte por versión y codificación; con If-None-Match se responde
+  304 sin cuerpo.
+"""
+
+import gzip
+import hashlib
+import threading
+from typing import Callable, Dict, Hashable, Union
+
+from flask import Response
+
+from scrapers.cache import TTLCache
+
+try:
+    import brotli
+except ImportError:  # brotli es opcional
+    brotli = None
+
+GZIP_LEVEL = 9
+# 11 es el máximo pero tarda demasiado en páginas grandes
+BROTLI_QUALITY = 9
+
+# Niveles para respuestas efímeras (consultas de búsqueda / paginación):
+# se sirven pocas veces, así que compensa comprimir rápido
+FAST_GZIP_LEVEL = 6
+FAST_BROTLI_QUALITY = 5
+
+# Solo se guardan las últimas versiones; las antiguas caducan solas
+MAX_VERSIONS = 2
+VERSION_TTL = 3600
+
+# Preferencia del servidor cuando el cliente acepta varias
+ENCODINGS = ("br", "gzip")
+
+# Cuerpos más pequeños no compensan la compresión
+MIN_COMPRESS_SIZE = 512
+
+
+class CachedBody:
+    """Un cuerpo y sus variantes comprimidas (bajo demanda), con su ETag por variante."""
+
+    def __init__(
+        self,
+        body: bytes,
+        tag: str,
+        gzip_level: int = GZIP_LEVEL,
+        brotli_quality: int = BROTLI_QUALITY,
+    ):
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.variants: Dict[str, bytes] = {"identity": body}
+        self._lock = threading.Lock()
+
+        encodings = ["identity"]
+        if len(body) >= MIN_COMPRESS_SIZE:
+            encodings.append("gzip")
+            if brotli is not None:
+                encodings.append("br")
+
+        # Cada codificación es una representación distinta: ETag distinto.
+        # Se conocen sin comprimir, así un 304 no comprime nada.
+        self.etags = {
+            encoding: tag if encoding == "identity" else f"{tag}-{encoding}"
+            for encoding in encodings
+        }
+
+    def choose(self, accept_encodings) -> str:
+        for encoding in ENCODINGS:
+            if encoding in self.etags and accept_encodings[encoding] > 0:
+                return encoding
+        return "identity"
+
+    def variant(self, encoding: str) -> bytes:
+        """Cuerpo en `encoding`; se comprime una sola vez, la primera vez que se pide."""
+        data = self.variants.get(encoding)
+        if data is not None:
+            return data
+
+        with self._lock:
+            data = self.variants.get(encoding)
+            if data is None:
+                body = self.variants["identity"]
+                if encoding == "gzip":
+                    data = gzip.compress(body, self.gzip_level, mtime=0)
+                else:
+                    data = brotli.compress(body, quality=self.brotli_quality)
+                self.variants[encoding] = data
+        return data
+
+
+class VersionedResponseCache:
+    def __init__(
+        self,
+        name: str,
+        content_type: str,
+        max_entries: int = MAX_VERSIONS,
+        gzip_level: int = GZIP_LEVEL,
+        brotli_quality: int = BROTLI_QUALITY,
+    ):
+        self.name = name
+        self.content_type = content_type
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self._bodies = TTLCache(ttl=VERSION_TTL, maxsize=max_entries)
+
+    def get(self, key: Hashable, render: Callable[[], Union[str, bytes]]) -> CachedBody:
+        """
+        Cuerpo de `key`: la versión del snapshot, o una tupla
+        (versión, ...) con lo demás de lo que dependa la respuesta.
+        Si no está, lo genera `render()` una sola vez aunque lleguen varias
+        peticiones a la vez.
+        """
+        def load():
+            body = render()
+            if isinstance(body, str):
+                body = body.encode("utf-8")
+            return CachedBody(body, self._tag(key), self.gzip_level, self.brotli_quality)
+
+        return self._bodies.get_or_load(key, load)
+
+    def response(self, key: Hashable, render: Callable[[], Union[str, bytes]], request) -> Response:
+        """Response de Flask para `request`: 304 o la variante comprimida adecuada."""
+        cached = self.get(key, render)
+        encoding = cached.choose(request.accept_encodings)
+        etag = cached.etags[encoding]
+
+        headers = {
+            "ETag": f'"{etag}"',
+            "Vary": "Accept-Encoding",
+            # El navegador puede guardarla pero debe revalidar (ETag) cada vez
+            "Cache-Control": "no-cache",
+        }
+
+        if request.if_none_match.contains_weak(etag):
+            return Response(status=304, headers=headers)
+
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return Response(
+            cached.variant(encoding),
+            status=200,
+            headers=headers,
+            content_type=self.content_type,
+        )
+
+    def clear(self):
+        self._bodies.clear()
+
+    def _tag(self, key: Hashable) -> str:
+        if not isinstance(key, tuple):
+            return f"{self.name}-{key}"
+        # Versión legible + huella corta del resto (sin caracteres raros en el ETag)
+        version, rest = key[0], key[1:]
+        digest = hashlib.sha1(repr(rest).encode("utf-8")).hexdigest()[:12]
+        return f"{self.name}-{version}-{digest}"
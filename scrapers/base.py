@@ -1,10 +1,69 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List
-from .models import Event
+from .models import Event, Stream
+from .http import AsyncHttpClient, shared_client
 
 class BaseProvider(ABC):
+    """
+    Contrato síncrono clásico. Las variantes async (fetch_events_async /
+    load_streams_async) ejecutan los métodos síncronos en un hilo, para que
+    ScraperService pueda componer todos los providers en un mismo event loop.
+    """
     name: str
 
+    # Planificación en background_worker (segundos)
+    refresh_interval: float = 120   # intervalo normal entre refrescos
+    refresh_jitter: float = 15      # ± aleatorio para no sincronizar providers
+    live_interval: float = 60       # intervalo con partidos en directo
+
+    @property
+    def http(self) -> AsyncHttpClient:
+        """Cliente HTTP compartido (se puede sustituir por instancia)."""
+        return getattr(self, "_http", None) or shared_client()
+
+    @http.setter
+    def http(self, client: AsyncHttpClient):
+        self._http = client
+
     @abstractmethod
     def fetch_events(self) -> List[Event]:
         pass
+
+    def load_streams(self, event_url: str) -> List[Stream]:
+        """Streams bajo demanda (solo providers con Lazy Streams)."""
+        return []
+
+    async def fetch_events_async(self) -> List[Event]:
+        return await asyncio.to_thread(self.fetch_events)
+
+    async def load_streams_async(self, event_url: str) -> List[Stream]:
+        return await asyncio.to_thread(self.load_streams, event_url)
+
+
+class AsyncBaseProvider(BaseProvider):
+    """
+    Contrato async nativo: el provider implementa fetch_events_async (y si
+    hace falta load_streams_async) usando self.http.fetch. Los métodos
+    síncronos son adaptadores que ejecutan la corrutina en el loop del
+    cliente HTTP compartido.
+
+    Ese loop es uno solo para todos los providers (y para /stream): en las
+    corrutinas solo va I/O. El parseo (BeautifulSoup, JSON) se ejecuta con
+    `await asyncio.to_thread(self._parse..., html)`, o con
+    `self.http.fetch_parsed(url, parse, anterior)` en las páginas de agenda
+    que solo se vuelven a parsear si han cambiado.
+    """
+
+    @abstractmethod
+    async def fetch_events_async(self) -> List[Event]:
+        pass
+
+    async def load_streams_async(self, event_url: str) -> List[Stream]:
+        return []
+
+    def fetch_events(self) -> List[Event]:
+        return self.http.run(self.fetch_events_async())
+
+    def load_streams(self, event_url: str) -> List[Stream]:
+        return self.http.run(self.load_streams_async(event_url))
@@ -0,0 +1,296 @@
+"""
+Capa HTTP compartida por los providers.
+
+• AsyncHttpClient: una única aiohttp.ClientSession para todos los providers,
+  que vive en su propio event loop (hilo de fondo) durante toda la vida del
+  proceso. Pool de conexiones con límite por host, caché de DNS (aiodns si
+  está instalado) y keep-alive: los handshakes TCP/TLS se amortizan entre
+  providers y entre ciclos del worker.
+• Peticiones condicionales: se guardan ETag / Last-Modified de cada url y se
+  envían If-None-Match / If-Modified-Since en la siguiente descarga.
+• Huella del cuerpo (sha1): aunque el servidor no soporte validadores, si la
+  página no ha cambiado el provider puede saltarse el parseo y reutilizar su
+  resultado anterior.
+
+Los providers síncronos usan get() / get_if_changed(); el código async usa
+directamente fetch() sobre el loop del cliente, o fetch_parsed() para las
+páginas que se parsean solo si han cambiado.
+"""
+
+import asyncio
+import atexit
+import hashlib
+import json
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, Optional, TypeVar
+
+import aiohttp
+from aiohttp.resolver import AsyncResolver, ThreadedResolver
+
+try:
+    import aiodns
+except ImportError:  # aiodns es opcional: sin él, DNS en el pool de hilos
+    aiodns = None
+
+# Límites del pool compartido
+MAX_CONNECTIONS = 100
+MAX_CONNECTIONS_PER_HOST = 8
+DNS_CACHE_TTL = 300
+KEEPALIVE_TIMEOUT = 60
+DEFAULT_TIMEOUT = 15
+
+T = TypeVar("T")
+
+
+class ConditionalCache:
+    """Validadores y huella del último cuerpo descargado, por url."""
+
+    def __init__(self):
+        self._entries: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def request_headers(self, url: str) -> dict:
+        with self._lock:
+            entry = self._entries.get(url)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def is_changed(self, url: str, status: int, body: bytes) -> bool:
+        """True si la respuesta difiere de la última registrada (sin registrarla)."""
+        if status == 304:
+            return False
+
+        fingerprint = hashlib.sha1(body).hexdigest()
+        with self._lock:
+            return fingerprint != self._entries.get(url, {}).get("fingerprint")
+
+    def update(self, url: str, status: int, headers, body: bytes) -> bool:
+        """Registra una respuesta y devuelve True si el contenido ha cambiado."""
+        if status == 304:
+            return False
+
+        fingerprint = hashlib.sha1(body).hexdigest()
+        with self._lock:
+            previous = self._entries.get(url, {}).get("fingerprint")
+            self._entries[url] = {
+                "etag": headers.get("ETag"),
+                "last_modified": headers.get("Last-Modified"),
+                "fingerprint": fingerprint,
+            }
+        return fingerprint != previous
+
+    def forget(self, url: str):
+        with self._lock:
+            self._entries.pop(url, None)
+
+
+class FetchResult:
+    """Respuesta ya leída (interfaz parecida a requests.Response)."""
+
+    def __init__(self, url: str, status_code: int, headers, content: bytes, encoding: str):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class AsyncHttpClient:
+    def __init__(
+        self,
+        max_connections: int = MAX_CONNECTIONS,
+        max_per_host: int = MAX_CONNECTIONS_PER_HOST,
+    ):
+        self.max_connections = max_connections
+        self.max_per_host = max_per_host
+        self.conditional = ConditionalCache()
+
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    # ==============================
+    #   Ciclo de vida
+    # ==============================
+    def start(self):
+        """Arranca (una sola vez) el loop de fondo y la sesión compartida."""
+        with self._start_lock:
+            if self._thread is not None:
+                return
+
+            self.loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=self.loop.run_forever, name="http-client", daemon=True
+            )
+            self._thread.start()
+            asyncio.run_coroutine_threadsafe(self._create_session(), self.loop).result()
+
+    async def _create_session(self):
+        # aiohttp usa ThreadedResolver por defecto aunque aiodns esté
+        # instalado: AsyncResolver se elige aquí explícitamente. Necesita
+        # DNSResolver.getaddrinfo (aiodns >= 3.2). En ambos casos con la
+        # caché DNS del conector.
+        if aiodns is not None and hasattr(aiodns.DNSResolver, "getaddrinfo"):
+            resolver = AsyncResolver()
+        else:
+            resolver = ThreadedResolver()
+
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.max_per_host,
+            use_dns_cache=True,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            resolver=resolver,
+        )
+        self._session = aiohttp.ClientSession(connector=connector)
+
+    def close(self):
+        if self._thread is None or self.loop is None:
+            return
+        if self._session is not None:
+            asyncio.run_coroutine_threadsafe(self._session.close(), self.loop).result(5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(5)
+        self._thread = None
+        self._session = None
+
+    def run(self, coro, timeout: Optional[float] = None):
+        """
+        Ejecuta una corrutina en el loop compartido desde código síncrono.
+        Si vence `timeout` la tarea se cancela y se lanza TimeoutError.
+        """
+        self.start()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("run() no puede llamarse desde el loop del cliente")
+
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        self.start()
+        return self._session
+
+    # ==============================
+    #   API async
+    # ==============================
+    async def fetch(
+        self,
+        url: str,
+        headers: Optional[dict] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        verify: bool = True,
+        conditional: bool = False,
+        force: bool = False,
+    ) -> Optional[FetchResult]:
+        """
+        Descarga `url` con la sesión compartida. Con `conditional=True`
+        devuelve None si no ha cambiado desde la última vez (304 o misma
+        huella); `force=True` ignora los validadores guardados. La huella se
+        guarda al descargar: para parsear la respuesta, mejor fetch_parsed().
+        """
+        headers = dict(headers or {})
+        if conditional and not force:
+            headers.update(self.conditional.request_headers(url))
+
+        async with self._session.get(
+            url,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            ssl=verify,
+        ) as resp:
+            if resp.status == 304 and conditional and not force:
+                return None
+            resp.raise_for_status()
+
+            body = await resp.read()
+            try:
+                encoding = resp.get_encoding()
+            except Exception:
+                encoding = "utf-8"
+            result = FetchResult(str(resp.url), resp.status, resp.headers, body, encoding)
+
+        if conditional:
+            changed = self.conditional.update(url, result.status_code, result.headers, body)
+            if not changed and not force:
+                return None
+        return result
+
+    async def fetch_parsed(
+        self,
+        url: str,
+        parse: Callable[[FetchResult], T],
+        previous: Optional[T] = None,
+        headers: Optional[dict] = None,
+        **kwargs,
+    ) -> T:
+        """
+        Descarga condicional + parseo. Si `url` no ha cambiado desde el
+        último parseo correcto devuelve `previous` tal cual; si no, ejecuta
+        `parse(resp)` en un hilo (el loop compartido solo hace I/O) y solo
+        después guarda validadores y huella. Si la descarga o el parseo
+        fallan no queda nada guardado y el próximo ciclo vuelve a parsear.
+        Sin `previous` (primera vez) se ignoran los validadores guardados.
+        """
+        force = previous is None
+        headers = dict(headers or {})
+        if not force:
+            headers.update(self.conditional.request_headers(url))
+
+        resp = await self.fetch(url, headers=headers, **kwargs)
+        if not force and not self.conditional.is_changed(url, resp.status_code, resp.content):
+            return previous
+
+        parsed = await asyncio.to_thread(parse, resp)
+        self.conditional.update(url, resp.status_code, resp.headers, resp.content)
+        return parsed
+
+    # ==============================
+    #   API síncrona (providers clásicos)
+    # ==============================
+    def get(self, url: str, timeout: float = DEFAULT_TIMEOUT, **kwargs) -> FetchResult:
+        return self.run(self.fetch(url, timeout=timeout, **kwargs), timeout + 5)
+
+    def get_if_changed(
+        self, url: str, force: bool = False, timeout: float = DEFAULT_TIMEOUT, **kwargs
+    ) -> Optional[FetchResult]:
+        return self.run(
+            self.fetch(url, timeout=timeout, conditional=True, force=force, **kwargs),
+            timeout + 5,
+        )
+
+
+_shared_client: Optional[AsyncHttpClient] = None
+_shared_lock = threading.Lock()
+
+
+def shared_client() -> AsyncHttpClient:
+    """Cliente HTTP único del proceso, compartido por todos los providers."""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = AsyncHttpClient()
+            atexit.register(_shared_client.close)
+        return _shared_client
@@ -0,0 +1,73 @@
+"""
+Refresco incremental de páginas de detalle.
+
+Cada fila de la agenda se identifica por una clave (normalmente la url del
+evento) y una firma con los datos visibles de la fila (equipos, hora, liga...).
+Entre ciclos solo se vuelven a descargar las páginas de detalle de las filas
+nuevas o cambiadas; las demás se revalidan con una cadencia más lenta.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+# Cada cuánto se vuelve a descargar el detalle de un evento sin cambios (segundos)
+REVALIDATE_INTERVAL = 900
+# Detalles sin streams todavía (suelen aparecer poco antes del partido)
+EMPTY_REVALIDATE_INTERVAL = 60
+
+
+class IncrementalTracker:
+    def __init__(self, revalidate_interval: float = REVALIDATE_INTERVAL):
+        self.revalidate_interval = revalidate_interval
+
+        # clave -> (firma, resultado, momento de la descarga, intervalo de revalidación)
+        self._entries: Dict[Hashable, Tuple[Hashable, Any, float, float]] = {}
+        self._lock = threading.Lock()
+
+    def plan(self, rows: Dict[Hashable, Hashable]) -> Tuple[List[Hashable], Dict[Hashable, Any]]:
+        """
+        Compara la agenda actual (clave -> firma) con lo ya descargado.
+        Devuelve (claves a descargar, resultados reutilizables por clave).
+        Las claves que ya no aparecen en la agenda se olvidan.
+        """
+        now = time.monotonic()
+        to_fetch: List[Hashable] = []
+        reused: Dict[Hashable, Any] = {}
+
+        with self._lock:
+            for key in list(self._entries):
+                if key not in rows:
+                    del self._entries[key]
+
+            for key, signature in rows.items():
+                entry = self._entries.get(key)
+                if (entry is not None
+                        and entry[0] == signature
+                        and now - entry[2] < entry[3]):
+                    reused[key] = entry[1]
+                else:
+                    to_fetch.append(key)
+
+        return to_fetch, reused
+
+    def record(
+        self,
+        key: Hashable,
+        signature: Hashable,
+        result: Any,
+        revalidate_interval: Optional[float] = None,
+    ):
+        """
+        Guarda el resultado de una descarga correcta. `revalidate_interval`
+        sustituye al del tracker para esta entrada (p. ej. más corto si la
+        página aún no tenía streams).
+        """
+        if revalidate_interval is None:
+            revalidate_interval = self.revalidate_interval
+        with self._lock:
+            self._entries[key] = (signature, result, time.monotonic(), revalidate_interval)
+
+    def forget(self, key: Hashable):
+        with self._lock:
+            self._entries.pop(key, None)
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field, asdict
-from typing import List, Optional
+from typing import List, Optional, TypeVar, Union
 
 
 @dataclass
@@ -30,3 +30,28 @@ class Event:
 
     def to_dict(self):
         return asdict(self)
+
+
+EventLike = TypeVar("EventLike", Event, dict)
+
+
+def _field(event: Union[Event, dict], name: str):
+    return event.get(name) if isinstance(event, dict) else getattr(event, name, None)
+
+
+def merge_events(events: List[EventLike]) -> List[EventLike]:
+    """
+    Ordena por start_time y elimina duplicados por id+liga.
+    Acepta Event o sus dicts (asdict): ScraperService y los segmentos del
+    worker deduplican con la misma regla.
+    """
+    seen = set()
+    unique = []
+    for e in sorted(events, key=lambda x: _field(x, "start_time") or 0):
+        key = (_field(e, "id"), _field(e, "league"))
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(e)
+
+    return unique
@@ -0,0 +1,67 @@
+"""
+Capa de parseo HTML para los providers.
+
+Todos los providers crean sus árboles con make_soup(). El backend se elige
+una sola vez al importar:
+
+• "lxml" (dependencia del proyecto en requirements.txt): parser en C,
+  bastante más rápido y con menos memoria en páginas grandes.
+• "html.parser" de la librería estándar solo si lxml no se puede importar
+  (por ejemplo, una instalación sin ruedas binarias); se avisa al importar.
+
+Se puede forzar con la variable de entorno SCRAPERS_HTML_PARSER
+(por ejemplo SCRAPERS_HTML_PARSER=html.parser).
+"""
+
+import os
+from typing import Dict, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+FALLBACK_BACKEND = "html.parser"
+
+
+def _detect_backend() -> str:
+    forced = os.environ.get("SCRAPERS_HTML_PARSER")
+    if forced:
+        return forced
+    try:
+        import lxml  # noqa: F401
+        return "lxml"
+    except ImportError:
+        print(f"[parsing] lxml no está instalado, se usa {FALLBACK_BACKEND} (más lento)")
+        return FALLBACK_BACKEND
+
+
+BACKEND = _detect_backend()
+
+
+def make_soup(
+    html: str,
+    parse_only: Optional[SoupStrainer] = None,
+    backend: Optional[str] = None,
+) -> BeautifulSoup:
+    """Construye el árbol BeautifulSoup con el backend configurado."""
+    return BeautifulSoup(html, backend or BACKEND, parse_only=parse_only)
+
+
+def _has_class(attrs, css_class: str) -> bool:
+    value = attrs.get("class") if attrs else None
+    if not value:
+        return False
+    if isinstance(value, str):
+        value = value.split()
+    return css_class in value
+
+
+def tag_class_strainer(tag_classes: Dict[str, str]) -> SoupStrainer:
+    """
+    SoupStrainer que solo conserva las etiquetas indicadas con su clase,
+    p. ej. {"a": "bottomgray", "span": "evdesc"}. El resto del documento
+    no llega a construirse como árbol.
+    """
+    def match(name, attrs=None):
+        css_class = tag_classes.get(name)
+        return css_class is not None and _has_class(attrs, css_class)
+
+    return SoupStrainer(match)
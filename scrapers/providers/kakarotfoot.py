@@ -1,18 +1,30 @@
-import requests
-from typing import List
+import json
+from typing import List, Optional
 from ..models import Event, Stream
-from ..base import BaseProvider
+from ..base import AsyncBaseProvider
+from ..utils import absolute_url
 
-class KakarotfootProvider(BaseProvider):
+class KakarotfootProvider(AsyncBaseProvider):
     name = "Kakarotfoot"
     FEED = "https://kakarotfoot.ru/json.php"
 
-    def fetch_events(self) -> List[Event]:
+    # Feed JSON ligero y con horas reales: se puede refrescar más a menudo
+    refresh_interval = 90
+
+    def __init__(self):
+        # Resultado anterior: se reutiliza si el feed no ha cambiado
+        self._last_events: Optional[List[Event]] = None
+
+    async def fetch_events_async(self) -> List[Event]:
+        # Si el feed no ha cambiado no se vuelve a parsear
+        self._last_events = await self.http.fetch_parsed(
+            self.FEED, lambda resp: self._parse_feed(resp.content), self._last_events, timeout=10
+        )
+        return self._last_events
+
+    def _parse_feed(self, content: bytes) -> List[Event]:
         events = []
-        try:
-            data = requests.get(self.FEED, timeout=10).json()
-        except:
-            return events
+        data = json.loads(content)
 
         for obj in data:
             es_channels = obj.get("streams", [])
@@ -20,7 +32,7 @@ class KakarotfootProvider(BaseProvider):
             event = Event(
                 id=obj["id"],
                 name=f"{obj['home']} vs {obj['away']}",
-                url=f"https://kakarotfoot.ru/{obj['url']}",
+                url=absolute_url(obj["url"], self.FEED),
                 league=obj.get("league", ""),
                 home=obj.get("home", ""),
                 away=obj.get("away", ""),
@@ -4,167 +4,289 @@ KevinSport Provider — Scraper completo y optimizado
 
 from __future__ import annotations
 import asyncio
-import aiohttp
-from bs4 import BeautifulSoup
-from typing import List
+from dataclasses import replace
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 
-from ..base import BaseProvider
+from ..base import AsyncBaseProvider
+from ..http import MAX_CONNECTIONS_PER_HOST
+from ..incremental import EMPTY_REVALIDATE_INTERVAL, IncrementalTracker, REVALIDATE_INTERVAL
 from ..models import Event, Stream
+from ..parsing import SoupStrainer, make_soup, tag_class_strainer
+from ..utils import absolute_url, split_teams
 
+HEADERS = {"User-Agent": "Mozilla/5.0"}
+TIMEOUT = 15
 
-class KevinsportProvider(BaseProvider):
+# En la agenda los equipos van como "Home Vs Away"
+KEVIN_SEPARATORS = (" Vs ",)
+
+# Solo se construye el árbol de lo que se lee en cada tipo de página
+SCHEDULE_STRAINER = tag_class_strainer({"table": "table-hover"})
+EVENT_STRAINER = SoupStrainer(["iframe", "a"])
+IFRAME_STRAINER = SoupStrainer("iframe")
+
+
+class KevinsportProvider(AsyncBaseProvider):
     name = "KevinSport"
     URL = "https://kevinsport.pro/live/football/"
 
-    def fetch_events(self) -> List[Event]:
-        try:
-            return asyncio.run(self.fetch_events_async())
-        except Exception as e:
-            print(f"[KevinSport] Error en fetch_events: {e}")
-            return []
+    # Descargas simultáneas en total y por host durante el rastreo
+    # (por host, lo mismo que permite el pool compartido)
+    MAX_IN_FLIGHT = 16
+    MAX_PER_HOST = MAX_CONNECTIONS_PER_HOST
+
+    # Tiempo máximo del ciclo (segundos), por debajo del deadline del
+    # provider en ScraperService: lo que no termine a tiempo se corta y se
+    # devuelve lo ya rastreado en lugar de perderlo todo
+    CRAWL_DEADLINE = 35
+
+    def __init__(
+        self,
+        revalidate_interval: float = REVALIDATE_INTERVAL,
+        max_in_flight: int = MAX_IN_FLIGHT,
+        max_per_host: int = MAX_PER_HOST,
+        crawl_deadline: float = CRAWL_DEADLINE,
+    ):
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_per_host = max(1, max_per_host)
+        self.crawl_deadline = crawl_deadline
+
+        # Páginas de evento ya rastreadas: solo se piden las nuevas o cambiadas
+        self.tracker = IncrementalTracker(revalidate_interval)
+
+        # Agenda anterior (eventos sin streams): se reutiliza si la página no cambió
+        self._last_schedule: Optional[List[Event]] = None
 
     async def fetch_events_async(self) -> List[Event]:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.crawl_deadline
+        events: List[Event] = []
+
+        # Petición condicional: si la página no cambió no se vuelve a parsear
+        schedule = await self.http.fetch_parsed(
+            self.URL,
+            lambda resp: self._parse_schedule(resp.text),
+            self._last_schedule,
+            headers=HEADERS,
+            timeout=TIMEOUT,
+        )
+        self._last_schedule = schedule
+
+        # Solo se rastrean los eventos nuevos, cambiados o pendientes de revalidar
+        rows = {ev.url: (ev.league, ev.match_time, ev.name) for ev in schedule}
+        to_fetch, reused = self.tracker.plan(rows)
+        to_fetch = set(to_fetch)
+
+        fresh: List[Event] = []
+        for template in schedule:
+            if template.url in to_fetch:
+                event = replace(template, streams=[])
+                fresh.append(event)
+                events.append(event)
+            elif template.url in reused:
+                events.append(reused[template.url])
+
+        def record(event: Event):
+            # Página sin streams todavía: se vuelve a mirar pronto
+            interval = None if event.streams else EMPTY_REVALIDATE_INTERVAL
+            self.tracker.record(event.url, rows[event.url], event, interval)
+
+        # Páginas de evento y streams secundarios en una cola acotada. Cada
+        # evento se registra en cuanto termina: si vence el deadline del
+        # provider, lo ya rastreado se reutiliza en el próximo ciclo
+        await self._crawl(fresh, record, max(0.0, deadline - loop.time()))
+
+        return events
+
+    def _parse_schedule(self, html: str) -> List[Event]:
+        """Eventos de la página principal, todavía sin streams."""
         events: List[Event] = []
 
-        timeout = aiohttp.ClientTimeout(total=15)
-        async with aiohttp.ClientSession(
-            headers={"User-Agent": "Mozilla/5.0"},
-            timeout=timeout
-        ) as session:
+        soup = make_soup(html, parse_only=SCHEDULE_STRAINER)
+        rows = soup.select("table.table-hover tr")
+        current_league = "(Desconocido)"
+
+        for row in rows:
+            classes = row.get("class", [])
+
+            # FILA DE LIGA
+            if "table-info" in classes:
+                txt = row.get_text(strip=True)
+                if txt:
+                    current_league = txt
+                continue
+
+            # FILA DE PARTIDO
+            if "table-dark" not in classes:
+                continue
+
+            # Hora
+            time_td = row.find("td", class_="matchtime")
+            match_time = time_td.get_text(strip=True) if time_td else ""
+
+            # Equipos
+            title_td = row.find("td", class_="pnltblttl")
+            title = title_td.get_text(strip=True) if title_td else "Unknown"
+
+            home, away = split_teams(title, KEVIN_SEPARATORS)
+
+            # Nombre formateado
+            name_final = (
+                f"{home} vs {away} ({match_time})"
+                if match_time else f"{home} vs {away}"
+            )
+
+            # Link de Watch
+            watch = row.find("a", href=True)
+            if not watch:
+                continue
+
+            event_page = absolute_url(watch["href"], self.URL)
+
+            events.append(Event(
+                id=event_page,
+                name=name_final,
+                url=event_page,
+                league=current_league,
+                home=home,
+                away=away,
+                start_time=0,
+                provider="KevinSport",
+                match_time=match_time,
+                streams=[]
+            ))
+
+        return events
+
+    async def _crawl(self, events: List[Event], on_done: Callable[[Event], None], timeout: float):
+        """
+        Rellena event.streams de todos los eventos con una única cola de
+        trabajo para páginas de evento y páginas de streams secundarios:
+        como mucho `max_in_flight` descargas a la vez en total y
+        `max_per_host` por host. El parseo de cada página va a un hilo para
+        no bloquear el loop compartido. Cada evento cuya página se cargó se
+        pasa a `on_done` en cuanto terminan también sus streams secundarios,
+        sin esperar al resto del rastreo. Pasado `timeout` se cancela lo
+        pendiente y los eventos sin terminar se quedan como estén.
+        """
+        if not events:
+            return
+
+        # LIFO: los streams secundarios de un evento se atienden antes que
+        # las páginas de evento pendientes, así cada evento termina (y se
+        # registra) pronto en lugar de todos a la vez al final del rastreo
+        queue: asyncio.Queue = asyncio.LifoQueue()
+        host_slots: Dict[str, asyncio.Semaphore] = {}
+        loaded = [False] * len(events)
+        # Streams secundarios de cada evento, en el orden de sus botones
+        secondary: List[List[Optional[Stream]]] = [[] for _ in events]
+        # Trabajos sin terminar de cada evento (su página y sus secundarios)
+        pending = [1] * len(events)
+
+        def finish(i: int):
+            pending[i] -= 1
+            if pending[i] or not loaded[i]:
+                return
+            event = events[i]
+            event.streams.extend(s for s in secondary[i] if s)
+            on_done(event)
+
+        async def fetch(url: str) -> str:
+            host = urlsplit(url).netloc
+            slot = host_slots.get(host)
+            if slot is None:
+                slot = host_slots[host] = asyncio.Semaphore(self.max_per_host)
+            async with slot:
+                return (await self.http.fetch(url, headers=HEADERS, timeout=TIMEOUT)).text
+
+        async def event_page(i: int):
+            event = events[i]
             try:
-                async with session.get(self.URL) as resp:
-                    html = await resp.text()
+                html = await fetch(event.url)
             except Exception as e:
-                print(f"[KevinSport] Error descargando página principal: {e}")
-                return events
-
-            soup = BeautifulSoup(html, "html.parser")
-            rows = soup.select("table.table-hover tr")
-            current_league = "(Desconocido)"
-            tasks = []
-
-            for row in rows:
-                classes = row.get("class", [])
-
-                # FILA DE LIGA
-                if "table-info" in classes:
-                    txt = row.get_text(strip=True)
-                    if txt:
-                        current_league = txt
-                    continue
-
-                # FILA DE PARTIDO
-                if "table-dark" not in classes:
-                    continue
-
-                # Hora
-                time_td = row.find("td", class_="matchtime")
-                match_time = time_td.get_text(strip=True) if time_td else ""
-
-                # Equipos
-                title_td = row.find("td", class_="pnltblttl")
-                title = title_td.get_text(strip=True) if title_td else "Unknown"
-
-                if " Vs " in title:
-                    home, away = title.split(" Vs ", 1)
-                else:
-                    home, away = title, ""
-
-                # Nombre formateado
-                name_final = (
-                    f"{home} vs {away} ({match_time})"
-                    if match_time else f"{home} vs {away}"
-                )
+                print(f"[KevinSport] Error cargando evento {event.url}: {e}")
+                return
 
-                # Link de Watch
-                watch = row.find("a", href=True)
-                if not watch:
-                    continue
-                    
-                event_page = watch["href"]
-                if not event_page.startswith("http"):
-                    event_page = f"https://kevinsport.pro{event_page}"
-
-                event = Event(
-                    id=event_page,
-                    name=name_final,
-                    url=event_page,
-                    league=current_league,
-                    home=home,
-                    away=away,
-                    start_time=0,
-                    provider="KevinSport",
-                    match_time=match_time,
-                    streams=[]
-                )
+            main_stream, buttons = await asyncio.to_thread(self._parse_event_page, html)
+            if main_stream:
+                event.streams.append(main_stream)
 
-                events.append(event)
-                tasks.append(self._load_streams_async(session, event))
+            # Cada stream secundario es un trabajo más de la cola
+            secondary[i] = [None] * len(buttons)
+            pending[i] += len(buttons)
+            for j, (name, href) in enumerate(buttons):
+                queue.put_nowait((sub_page, i, j, name, href))
+            loaded[i] = True
 
-            # Esperar a que todos los streams se carguen
+        async def sub_page(i: int, j: int, name: str, href: str):
             try:
-                await asyncio.gather(*tasks, return_exceptions=True)
+                html = await fetch(href)
             except Exception as e:
-                print(f"[KevinSport] Error en gather de streams: {e}")
-                
-            return events
+                print(f"[KevinSport] Error en stream secundario {href}: {e}")
+                return
+
+            src = await asyncio.to_thread(self._parse_sub_page, html)
+            if src:
+                secondary[i][j] = Stream(name=name, url=src, source="KevinSport")
+
+        async def worker():
+            while True:
+                job, i, *args = await queue.get()
+                try:
+                    await job(i, *args)
+                except Exception as e:
+                    print(f"[KevinSport] Error en la cola de rastreo: {e}")
+                finally:
+                    queue.task_done()
+                # Un trabajo cancelado no llega aquí: su evento queda sin terminar
+                finish(i)
 
-    async def _load_streams_async(self, session, event: Event):
-        # Página principal del evento
+        for i in reversed(range(len(events))):
+            queue.put_nowait((event_page, i))
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(self.max_in_flight)]
         try:
-            async with session.get(event.url) as r:
-                html = await r.text()
-        except Exception as e:
-            print(f"[KevinSport] Error cargando evento {event.url}: {e}")
-            return
+            await asyncio.wait_for(queue.join(), timeout)
+        except asyncio.TimeoutError:
+            unfinished = sum(1 for n in pending if n)
+            print(f"[KevinSport] {unfinished} eventos sin terminar antes del deadline")
+        finally:
+            # También si vence el deadline del provider: no dejar workers vivos
+            for w in workers:
+                w.cancel()
 
-        soup = BeautifulSoup(html, "html.parser")
+    def _parse_event_page(self, html: str) -> Tuple[Optional[Stream], List[Tuple[str, str]]]:
+        """Stream principal (iframe) y botones "Stream N" como (nombre, url)."""
+        soup = make_soup(html, parse_only=EVENT_STRAINER)
 
         # Iframe principal
+        main_stream = None
         iframe = soup.find("iframe")
         if iframe:
             src = iframe.get("src")
             if src:
-                if not src.startswith("http"):
-                    src = f"https:{src}" if src.startswith("//") else f"https://kevinsport.pro{src}"
-                    
-                event.streams.append(Stream(
+                main_stream = Stream(
                     name="Stream 1",
-                    url=src,
+                    url=absolute_url(src, self.URL),
                     source="KevinSport"
-                ))
+                )
 
         # Streams secundarios
-        stream_buttons = soup.find_all("a", string=lambda t: t and "Stream" in t)
-
-        for btn in stream_buttons:
+        buttons = []
+        for btn in soup.find_all("a", string=lambda t: t and "Stream" in t):
             href = btn.get("href")
             if not href:
                 continue
-                
-            if not href.startswith("http"):
-                href = f"https://kevinsport.pro{href}"
-
-            try:
-                async with session.get(href) as r2:
-                    sub_html = await r2.text()
-            except Exception as e:
-                print(f"[KevinSport] Error en stream secundario {href}: {e}")
-                continue
+            buttons.append((btn.get_text(strip=True), absolute_url(href, self.URL)))
 
-            sub_soup = BeautifulSoup(sub_html, "html.parser")
-            sub_iframe = sub_soup.find("iframe")
+        return main_stream, buttons
 
-            if not sub_iframe:
-                continue
+    def _parse_sub_page(self, html: str) -> Optional[str]:
+        """url absoluta del iframe de una página de stream secundario."""
+        sub_iframe = make_soup(html, parse_only=IFRAME_STRAINER).find("iframe")
+        if not sub_iframe:
+            return None
 
-            src = sub_iframe.get("src")
-            if src:
-                if not src.startswith("http"):
-                    src = f"https:{src}" if src.startswith("//") else f"https://kevinsport.pro{src}"
-                    
-                event.streams.append(Stream(
-                    name=btn.get_text(strip=True),
-                    url=src,
-                    source="KevinSport"
-                ))
\ No newline at end of file
+        src = sub_iframe.get("src")
+        return absolute_url(src, self.URL) if src else None
@@ -13,92 +13,132 @@ que llama a load_streams(event.url) cuando source == "LiveTV".
 
 from __future__ import annotations
 
-from typing import List, Tuple
+import asyncio
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Dict, List, Optional, Set, Tuple
 import re
 
-import requests
-from bs4 import BeautifulSoup
-import urllib3
-
-from ..base import BaseProvider
+from ..base import AsyncBaseProvider
+from ..cache import TTLCache
 from ..models import Event, Stream
-
-# Desactivar warnings de certificados raros de LiveTV
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+from ..parsing import SoupStrainer, make_soup, tag_class_strainer
+from ..utils import absolute_url, split_teams, text_in_parens
 
 # User-Agent para que LiveTV no nos bloquee tan fácil
 UA_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:128.0) Gecko/20100101 Firefox/128.0"
 }
 
+# Solo interesan los enlaces de partido y su descripción (hora + liga)
+SCHEDULE_STRAINER = tag_class_strainer({"a": "bottomgray", "span": "evdesc"})
+# En eventinfo / webplayer solo se leen enlaces, scripts e iframes
+EVENTINFO_STRAINER = SoupStrainer(["a", "script", "iframe"])
+IFRAME_STRAINER = SoupStrainer("iframe")
+
+# urls de webplayer.php escritas dentro de los <script> de eventinfo
+WEBPLAYER_RE = re.compile(r"https?://[^'\" ]*webplayer\.php[^'\" ]*")
+
+# Streams resueltos por url de eventinfo, compartidos entre todas las
+# instancias del provider y entre los espectadores concurrentes de /stream
+STREAMS_TTL = 120
+EMPTY_STREAMS_TTL = 15
+# Espera máxima de load_streams (síncrono): eventinfo + deadline de webplayers
+LOAD_STREAMS_TIMEOUT = 30
+_streams_cache = TTLCache(ttl=STREAMS_TTL, maxsize=256)
+
 
-class LiveTVProvider(BaseProvider):
+class LiveTVProvider(AsyncBaseProvider):
     name = "LiveTV"
 
     # Página de próximos partidos (football)
     LIST_URL = "https://livetv.sx/enx/allupcomingsports/1/"
 
+    # La agenda de próximos partidos cambia despacio y los streams son lazy
+    refresh_interval = 300
+    live_interval = 300
+
+    # Tiempo total para resolver todos los webplayer.php en /stream (segundos)
+    WEBPLAYER_DEADLINE = 6
+    MAX_WEBPLAYERS_IN_FLIGHT = 10
+
+    def __init__(self):
+        # Resultado anterior: se reutiliza si la lista no ha cambiado
+        self._last_events: Optional[List[Event]] = None
+
+        # Scrapings de streams en curso por url (solo se tocan desde el loop del cliente)
+        self._loading: Dict[str, asyncio.Future] = {}
+
     # ==============================
     #   PUBLIC: fetch_events (index)
     # ==============================
-    def fetch_events(self) -> List[Event]:
+    async def fetch_events_async(self) -> List[Event]:
         """
         Descarga la lista de partidos de LiveTV y crea objetos Event
         SIN rellenar streams (Lazy Streams).
         """
+        # Certificados raros en LiveTV: sin verificación SSL
+        self._last_events = await self.http.fetch_parsed(
+            self.LIST_URL,
+            lambda resp: self._parse_schedule(resp.text),
+            self._last_events,
+            headers=UA_HEADERS,
+            timeout=20,
+            verify=False,
+        )
+        return self._last_events
+
+    def _parse_schedule(self, html: str) -> List[Event]:
+        """
+        Extrae los partidos en una sola pasada. Solo se construyen los
+        <a class="bottomgray"> y <span class="evdesc"> (SoupStrainer); cada
+        enlace se empareja con el siguiente evdesc del documento, igual que
+        haría find_next() pero sin recorrer el árbol por cada enlace.
+        """
         events: List[Event] = []
+        soup = make_soup(html, parse_only=SCHEDULE_STRAINER)
 
-        try:
-            resp = requests.get(
-                self.LIST_URL,
-                headers=UA_HEADERS,
-                timeout=20,
-                verify=False,
-            )
-            resp.raise_for_status()
-        except Exception as e:
-            print("[LiveTV] Error al descargar LIST_URL:", e)
-            return events
+        # Enlaces que aún esperan su <span class="evdesc">
+        pending: List[Tuple[str, str, str]] = []
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+        def flush(raw_desc: str):
+            # Liga = texto entre paréntesis
+            league = text_in_parens(raw_desc)
+
+            for event_url, home, away in pending:
+                # NO convertimos la hora a timestamp para evitar 1970-01-01
+                # Devolvemos start_time=0 para que el filtro datetime muestre "-"
+                events.append(Event(
+                    id=event_url,
+                    name=f"{home} vs {away}",
+                    url=event_url,
+                    league=league or "LiveTV",
+                    home=home,
+                    away=away,
+                    start_time=0,
+                    provider=self.name,
+                    streams=[],  # Lazy Streams: se llenan en load_streams()
+                ))
+            pending.clear()
 
-        # Cada partido está en un <td> con un <a class="bottomgray"> que apunta a /eventinfo/
-        for a in soup.find_all("a", href=True, class_="bottomgray"):
-            href = a["href"]
-            if "eventinfo" not in href:
+        for tag in soup.find_all(["a", "span"]):
+            if tag.name == "span":
+                # Span con hora + liga:  <span class="evdesc">23:30 (Brazil. Serie A)</span>
+                if pending and "evdesc" in tag.get("class", []):
+                    flush(tag.get_text(" ", strip=True))
                 continue
 
-            event_url = href if href.startswith("http") else f"https://livetv.sx{href}"
+            # Cada partido tiene un <a class="bottomgray"> que apunta a /eventinfo/
+            href = tag.get("href")
+            if not href or "bottomgray" not in tag.get("class", []) or "eventinfo" not in href:
+                continue
 
-            title = " ".join(a.stripped_strings)  # Ej: "Fluminense – Flamengo-RJ"
-            home, away = self._split_teams(title)
+            event_url = absolute_url(href, self.LIST_URL)
 
-            # Span con hora + liga:  <span class="evdesc">23:30 (Brazil. Serie A)</span>
-            evdesc = a.find_next("span", class_="evdesc")
-            raw_desc = evdesc.get_text(" ", strip=True) if evdesc else ""
+            title = " ".join(tag.stripped_strings)  # Ej: "Fluminense – Flamengo-RJ"
+            home, away = split_teams(title)
+            pending.append((event_url, home, away))
 
-            # Liga = texto entre paréntesis
-            league = ""
-            m = re.search(r"\((.*?)\)", raw_desc)
-            if m:
-                league = m.group(1).strip()
-
-            # NO convertimos la hora a timestamp para evitar 1970-01-01
-            # Devolvemos start_time=0 para que el filtro datetime muestre "-"
-            start_time = 0
-
-            event = Event(
-                id=event_url,
-                name=f"{home} vs {away}",
-                url=event_url,
-                league=league or "LiveTV",
-                home=home,
-                away=away,
-                start_time=start_time,
-                provider=self.name,
-                streams=[],  # Lazy Streams: se llenan en load_streams()
-            )
-            events.append(event)
+        flush("")
 
         # Eliminar duplicados por URL
         unique: List[Event] = []
@@ -108,7 +148,6 @@ class LiveTVProvider(BaseProvider):
                 continue
             seen.add(ev.url)
             unique.append(ev)
-
         return unique
 
     # ==============================
@@ -117,81 +156,86 @@ class LiveTVProvider(BaseProvider):
     def load_streams(self, event_url: str) -> List[Stream]:
         """
         Se llama desde /stream para obtener los streams de un evento LiveTV.
-        Hace scraping de la página de eventinfo y, si es necesario, de webplayer.php.
+        Adaptador síncrono de load_streams_async, con LOAD_STREAMS_TIMEOUT.
         """
-        return self._parse_event_streams(event_url)
+        try:
+            return self.http.run(self.load_streams_async(event_url), LOAD_STREAMS_TIMEOUT)
+        except FutureTimeoutError:
+            print(f"[LiveTV] Streams de {event_url} sin respuesta a tiempo")
+            return []
 
-    # ==============================
-    #   PRIVATE: utils
-    # ==============================
-    def _split_teams(self, title: str) -> Tuple[str, str]:
-        """Divide 'Home – Away' en (home, away)."""
-        for sep in [" – ", " - ", " vs ", " Vs ", " v "]:
-            if sep in title:
-                h, a = title.split(sep, 1)
-                return h.strip(), a.strip()
-        return title.strip(), ""
-
-    def _absolute_from(self, base: str, url: str) -> str:
-        """Convierte urls relativas o //cdn a urls absolutas."""
-        if url.startswith("http://") or url.startswith("https://"):
-            return url
-        if url.startswith("//"):
-            return "https:" + url
-
-        m = re.match(r"(https?://[^/]+)", base)
-        root = m.group(1) if m else "https://livetv.sx"
-
-        if url.startswith("/"):
-            return root + url
-        return root + "/" + url.lstrip("/")
+    async def load_streams_async(self, event_url: str) -> List[Stream]:
+        """
+        Hace scraping de la página de eventinfo y, si es necesario, de
+        webplayer.php. El resultado se cachea STREAMS_TTL segundos y las
+        visitas simultáneas al mismo evento esperan a un único scraping (un
+        future por url en el loop del cliente HTTP).
+        """
+        if asyncio.get_running_loop() is not self.http.loop:
+            # La coalescencia vive en el loop del cliente compartido
+            self.http.start()
+            return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(
+                self.load_streams_async(event_url), self.http.loop
+            ))
+
+        streams = _streams_cache.get(event_url)
+        if streams is not None:
+            return list(streams)
+
+        loading = self._loading.get(event_url)
+        if loading is None:
+            loading = asyncio.ensure_future(self._load_and_cache(event_url))
+            self._loading[event_url] = loading
+            loading.add_done_callback(lambda _: self._loading.pop(event_url, None))
+
+        # shield: si un espectador se va (o vence su timeout), el scraping
+        # sigue para los demás y su resultado acaba en la caché
+        return list(await asyncio.shield(loading))
+
+    async def _load_and_cache(self, event_url: str) -> List[Stream]:
+        try:
+            streams = await self._parse_event_streams(event_url)
+        except Exception as e:
+            print("[LiveTV] Error cargando streams:", e)
+            streams = []
+
+        # Fallo o evento sin streams todavía: reintentar pronto
+        _streams_cache.set(event_url, streams, ttl=None if streams else EMPTY_STREAMS_TTL)
+        return streams
 
     # ==============================
     #   PRIVATE: scraping de streams
     # ==============================
-    def _parse_event_streams(self, event_url: str) -> List[Stream]:
+    async def _parse_event_streams(self, event_url: str) -> List[Stream]:
         """
         1. Descarga la página de eventinfo.
         2. Busca urls de webplayer.php.
-        3. De cada webplayer.php extrae el <iframe src="..."> real del stream.
+        3. De cada webplayer.php (en paralelo, con deadline global) extrae
+           el <iframe src="..."> real del stream.
         4. Si no encuentra webplayer, intenta directamente iframes en eventinfo.
         """
         streams: List[Stream] = []
 
         # ---- Paso 1: eventinfo ----
         try:
-            resp = requests.get(
+            resp = await self.http.fetch(
                 event_url,
                 headers=UA_HEADERS,
                 timeout=20,
                 verify=False,
             )
-            resp.raise_for_status()
         except Exception as e:
             print("[LiveTV] Error al descargar eventinfo:", e)
             return streams
 
-        soup = BeautifulSoup(resp.text, "html.parser")
-
-        webplayer_urls = set()
-
-        # a) enlaces directos a webplayer.php
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            if "webplayer.php" in href:
-                webplayer_urls.add(self._absolute_from(event_url, href))
-
-        # b) urls dentro de scripts
-        for script in soup.find_all("script"):
-            txt = script.string or ""
-            for m in re.findall(r"(https?://[^'\" ]*webplayer\.php[^'\" ]*)", txt):
-                webplayer_urls.add(m)
+        # El parseo va a un hilo: el loop sigue atendiendo otras descargas
+        webplayer_urls, iframe_urls = await asyncio.to_thread(
+            self._parse_eventinfo, resp.text, event_url
+        )
 
         # ---- Caso especial: sin webplayer, pero con iframe directo ----
         if not webplayer_urls:
-            for iframe in soup.find_all("iframe", src=True):
-                src = iframe["src"]
-                full = self._absolute_from(event_url, src)
+            for full in iframe_urls:
                 streams.append(Stream(
                     name="Stream 1",
                     url=full,
@@ -200,33 +244,85 @@ class LiveTVProvider(BaseProvider):
                 ))
             return streams
 
-        # ---- Paso 2: visitar cada webplayer y extraer iframe ----
-        for idx, wp_url in enumerate(sorted(webplayer_urls), start=1):
+        # ---- Paso 2: visitar todos los webplayer a la vez y extraer iframe ----
+        # Lo que no haya respondido antes del deadline se descarta
+        wp_list = sorted(webplayer_urls)
+        semaphore = asyncio.Semaphore(self.MAX_WEBPLAYERS_IN_FLIGHT)
+
+        async def resolve(wp_url: str) -> Optional[str]:
+            async with semaphore:
+                return await self._resolve_webplayer(wp_url)
+
+        tasks = {
+            asyncio.ensure_future(resolve(wp_url)): idx
+            for idx, wp_url in enumerate(wp_list, start=1)
+        }
+        done, not_done = await asyncio.wait(tasks, timeout=self.WEBPLAYER_DEADLINE)
+        for task in not_done:
+            task.cancel()
+
+        if not_done:
+            print(f"[LiveTV] {len(not_done)} webplayer sin respuesta antes del deadline")
+
+        resolved = {}
+        for task in done:
             try:
-                wp_resp = requests.get(
-                    wp_url,
-                    headers=UA_HEADERS,
-                    timeout=20,
-                    verify=False,
-                )
-                wp_resp.raise_for_status()
+                full = task.result()
             except Exception as e:
                 print("[LiveTV] Error al descargar webplayer:", e)
                 continue
+            if full:
+                resolved[tasks[task]] = full
 
-            wp_soup = BeautifulSoup(wp_resp.text, "html.parser")
-            iframe = wp_soup.find("iframe", src=True)
-            if not iframe:
-                continue
-
-            src = iframe["src"]
-            full = self._absolute_from(wp_url, src)
-
+        for idx in sorted(resolved):
             streams.append(Stream(
                 name=f"Stream {idx}",
-                url=full,
+                url=resolved[idx],
                 source=self.name,
                 language=None,
             ))
 
         return streams
+
+    async def _resolve_webplayer(self, wp_url: str) -> Optional[str]:
+        """Descarga un webplayer.php y devuelve la url absoluta de su iframe."""
+        wp_resp = await self.http.fetch(
+            wp_url,
+            headers=UA_HEADERS,
+            timeout=self.WEBPLAYER_DEADLINE,
+            verify=False,
+        )
+
+        return await asyncio.to_thread(self._parse_webplayer, wp_resp.text, wp_url)
+
+    def _parse_eventinfo(self, html: str, event_url: str) -> Tuple[Set[str], List[str]]:
+        """urls de webplayer.php de una página de eventinfo y sus iframes directos."""
+        soup = make_soup(html, parse_only=EVENTINFO_STRAINER)
+
+        webplayer_urls = set()
+
+        # a) enlaces directos a webplayer.php
+        for a in soup.find_all("a", href=True):
+            href = a["href"]
+            if "webplayer.php" in href:
+                webplayer_urls.add(absolute_url(href, event_url))
+
+        # b) urls dentro de scripts
+        for script in soup.find_all("script"):
+            txt = script.string or ""
+            if "webplayer.php" in txt:
+                webplayer_urls.update(WEBPLAYER_RE.findall(txt))
+
+        iframe_urls = [
+            absolute_url(iframe["src"], event_url)
+            for iframe in soup.find_all("iframe", src=True)
+        ]
+        return webplayer_urls, iframe_urls
+
+    def _parse_webplayer(self, html: str, wp_url: str) -> Optional[str]:
+        """url absoluta del <iframe> de un webplayer.php."""
+        iframe = make_soup(html, parse_only=IFRAME_STRAINER).find("iframe", src=True)
+        if not iframe:
+            return None
+
+        return absolute_url(iframe["src"], wp_url)
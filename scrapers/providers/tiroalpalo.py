@@ -1,28 +1,70 @@
 from __future__ import annotations
-import re
-from datetime import datetime
+import asyncio
+from datetime import datetime, timedelta
 from typing import List, Optional
-import requests
-from bs4 import BeautifulSoup
-from ..base import BaseProvider
+from ..base import AsyncBaseProvider
+from ..incremental import EMPTY_REVALIDATE_INTERVAL, IncrementalTracker, REVALIDATE_INTERVAL
 from ..models import Event, Stream
+from ..parsing import SoupStrainer, make_soup
+from ..utils import VS_RE, absolute_url, split_teams, split_time_prefix
 
-class TiroalpaloProvider(BaseProvider):
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+}
+
+# Solo se construye el árbol de lo que se lee en cada tipo de página
+LIST_STRAINER = SoupStrainer("a", href=True)
+EVENT_STRAINER = SoupStrainer(["h1", "h2", "h3", "iframe", "a"])
+
+TIRO_SEPARATORS = (" vs ", "-")
+# Textos de enlace que suelen apuntar a un stream
+STREAM_KEYWORDS = ("link", "alternativo", "stream", "ver", "canal")
+
+
+class TiroalpaloProvider(AsyncBaseProvider):
     name = "Tiroalpalo"
     LIST_URL = "https://tiroalpalome.com/directo"
 
-    def fetch_events(self) -> List[Event]:
-        events = []
-        try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-            html = requests.get(self.LIST_URL, timeout=15, headers=headers).text
-        except Exception as e:
-            print(f"[Tiroalpalo] Error descargando lista: {e}")
-            return events
+    # Máximo de páginas de evento descargándose a la vez
+    MAX_IN_FLIGHT = 8
+
+    # Tiempo máximo del ciclo (segundos), por debajo del deadline del
+    # provider en ScraperService: las páginas que no lleguen a tiempo se
+    # descartan y se devuelven las ya parseadas
+    CRAWL_DEADLINE = 35
+
+    def __init__(
+        self,
+        max_in_flight: int = MAX_IN_FLIGHT,
+        revalidate_interval: float = REVALIDATE_INTERVAL,
+        crawl_deadline: float = CRAWL_DEADLINE,
+    ):
+        self.max_in_flight = max(1, max_in_flight)
+        self.crawl_deadline = crawl_deadline
+
+        # Páginas de evento ya descargadas: solo se piden las nuevas o cambiadas
+        self.tracker = IncrementalTracker(revalidate_interval)
+
+        # Enlaces de la última lista: se reutilizan si la página no ha cambiado
+        self._last_links: Optional[List[tuple]] = None
+
+    async def fetch_events_async(self) -> List[Event]:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.crawl_deadline
+
+        links = await self.http.fetch_parsed(
+            self.LIST_URL,
+            lambda resp: self._parse_list(resp.text),
+            self._last_links,
+            headers=HEADERS,
+            timeout=15,
+        )
+        self._last_links = links
 
-        soup = BeautifulSoup(html, "html.parser")
+        return await self._fetch_event_pages(links, max(0.0, deadline - loop.time()))
+
+    def _parse_list(self, html: str) -> List[tuple]:
+        soup = make_soup(html, parse_only=LIST_STRAINER)
 
         links = []
         # Buscar enlaces que parezcan eventos deportivos
@@ -31,71 +73,75 @@ class TiroalpaloProvider(BaseProvider):
             text = a.get_text(strip=True)
             
             # Asegurarse que sea una URL completa
-            if not href.startswith("http"):
-                if href.startswith("/"):
-                    href = f"https://tiroalpalome.com{href}"
-                else:
-                    href = f"https://tiroalpalome.com/{href}"
+            href = absolute_url(href, self.LIST_URL)
             
             # Filtrar por URLs que parezcan eventos
             if "tiroalpalome.com" in href and ("-" in text or " vs " in text.lower()):
                 links.append((href, text))
 
         seen = set()
+        unique_links = []
         for href, text in links:
             if href in seen:
                 continue
             seen.add(href)
+            unique_links.append((href, text))
+
+        return unique_links
+
+    async def _fetch_event_pages(self, links: List[tuple], timeout: float) -> List[Event]:
+        # El texto del enlace es la firma de la fila: si no cambia, se
+        # reutiliza el evento ya parseado hasta que toque revalidarlo
+        rows = dict(links)
+        to_fetch, results = self.tracker.plan(rows)
 
+        # Descargar páginas de evento con concurrencia acotada; cada página
+        # se parsea (en un hilo, fuera del loop) y se registra en cuanto llega
+        # su respuesta: si vence el deadline del provider, lo ya descargado
+        # se reutiliza en el próximo ciclo
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+
+        async def fetch_one(href: str):
             try:
-                event = self._parse_event_page(href, text)
-                if event:
-                    events.append(event)
+                async with semaphore:
+                    resp = await self.http.fetch(href, headers=HEADERS, timeout=15)
+                outcome = await asyncio.to_thread(self._parse_event_page, href, rows[href], resp.text)
             except Exception as e:
+                # Sin registrar: se reintenta en el próximo ciclo
                 print(f"[Tiroalpalo] Error parseando {href}: {e}")
-                continue
-
-        return events
+                return
+            # Sin streams (None): los enlaces suelen aparecer poco antes del
+            # partido, así que se vuelve a mirar pronto
+            interval = None if outcome else EMPTY_REVALIDATE_INTERVAL
+            self.tracker.record(href, rows[href], outcome, interval)
+            results[href] = outcome
+
+        if to_fetch:
+            tasks = [asyncio.ensure_future(fetch_one(href)) for href in to_fetch]
+            try:
+                _, not_done = await asyncio.wait(tasks, timeout=timeout)
+            finally:
+                # También si se cancela el provider: no dejar descargas sueltas
+                for task in tasks:
+                    task.cancel()
+            if not_done:
+                print(f"[Tiroalpalo] {len(not_done)} páginas sin respuesta antes del deadline")
 
-    def _parse_event_page(self, url: str, fallback: str) -> Optional[Event]:
-        try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-            html = requests.get(url, timeout=15, headers=headers).text
-        except Exception as e:
-            print(f"[Tiroalpalo] Error descargando página: {e}")
-            return None
+        # Mantener el orden de la página de directos
+        return [results[href] for href, _ in links if results.get(href)]
 
-        soup = BeautifulSoup(html, "html.parser")
+    def _parse_event_page(self, url: str, fallback: str, html: str) -> Optional[Event]:
+        soup = make_soup(html, parse_only=EVENT_STRAINER)
 
         # Título
         title_tag = soup.find(["h1", "h2", "h3"])
         title = title_tag.get_text(strip=True) if title_tag else fallback
 
-        match_time = None
-        home = ""
-        away = ""
-
         # Intentar extraer hora del título
-        m = re.match(r"(\d{1,2}:\d{2})\s*[|\-]?(.*)", title)
-        if m:
-            match_time = m.group(1)
-            title_no_time = m.group(2).strip()
-        else:
-            title_no_time = title
-
-        # Separar equipos
-        if " vs " in title_no_time.lower():
-            parts = re.split(r"\s+vs\s+", title_no_time, flags=re.IGNORECASE)
-            if len(parts) == 2:
-                home, away = parts[0].strip(), parts[1].strip()
-        elif "-" in title_no_time:
-            parts = title_no_time.split("-", 1)
-            if len(parts) == 2:
-                home, away = parts[0].strip(), parts[1].strip()
-        else:
-            home = title_no_time
+        match_time, title_no_time = split_time_prefix(title)
+
+        # Separar equipos ("vs" en cualquier mayúscula, si no "-")
+        home, away = split_teams(VS_RE.sub(" vs ", title_no_time), TIRO_SEPARATORS)
 
         # Convertir hora a timestamp si existe
         start_ms = 0
@@ -105,7 +151,6 @@ class TiroalpaloProvider(BaseProvider):
                 now = datetime.utcnow()
                 dt = now.replace(hour=hh, minute=mm, second=0, microsecond=0)
                 if dt < now:
-                    from datetime import timedelta
                     dt = dt + timedelta(days=1)
                 start_ms = int(dt.timestamp() * 1000)
             except Exception as e:
@@ -127,14 +172,15 @@ class TiroalpaloProvider(BaseProvider):
         
         # Buscar enlaces con texto de stream
         for a in soup.find_all("a", href=True):
-            text = a.get_text(strip=True).lower()
-            if any(keyword in text for keyword in ["link", "alternativo", "stream", "ver", "canal"]):
+            label = a.get_text(strip=True)
+            text = label.lower()
+            if any(keyword in text for keyword in STREAM_KEYWORDS):
                 href = a["href"]
                 if not href.startswith("http"):
                     continue
                     
                 streams.append(Stream(
-                    name=a.get_text(strip=True),
+                    name=label,
                     url=href,
                     source="Tiroalpalo"
                 ))
@@ -0,0 +1,157 @@
+"""
+Planificador adaptativo por provider para background_worker.
+
+• Cada provider tiene su propio intervalo (refresh_interval) y jitter, y se
+  ejecuta en su propio hilo: un provider lento no retrasa a los demás.
+• Si un provider falla (excepción) se aplica backoff exponencial hasta
+  MAX_BACKOFF. Cero eventos es un resultado válido (no hay partidos) y
+  sustituye a la agenda anterior del provider.
+• Si alguno de sus eventos está en directo o a punto de empezar, se usa
+  live_interval para tener la agenda más fresca. Los providers sin
+  start_time (KevinSport) se miran por su match_time "HH:MM".
+"""
+
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+from .base import BaseProvider
+from .models import Event
+
+MIN_INTERVAL = 10
+MAX_BACKOFF = 1800
+
+# Ventana de "partido en directo" alrededor de start_time (segundos)
+LIVE_BEFORE = 15 * 60
+LIVE_AFTER = 2 * 60 * 60
+
+DAY_MS = 24 * 60 * 60 * 1000
+CLOCK_RE = re.compile(r"(\d{1,2}):(\d{2})")
+
+
+class ProviderSchedule:
+    def __init__(self, provider: BaseProvider):
+        self.provider = provider
+        self.next_run = 0.0
+        self.failures = 0
+        self.running = False
+        self.events: List[Event] = []
+
+
+class ProviderScheduler:
+    def __init__(
+        self,
+        providers: List[BaseProvider],
+        fetch: Callable[[BaseProvider], List[Event]],
+        on_result: Callable[[BaseProvider, Optional[List[Event]]], None],
+    ):
+        """
+        `fetch(provider)` descarga los eventos de un provider (puede lanzar).
+        `on_result(provider, events)` se llama tras cada ejecución; events es
+        None si el provider falló.
+        """
+        self.fetch = fetch
+        self.on_result = on_result
+        self.schedules = [ProviderSchedule(p) for p in providers]
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, len(self.schedules)),
+            thread_name_prefix="scheduler",
+        )
+
+    def run_forever(self):
+        while not self._stop.is_set():
+            now = time.monotonic()
+            with self._lock:
+                for sched in self.schedules:
+                    if not sched.running and sched.next_run <= now:
+                        sched.running = True
+                        self._pool.submit(self._run, sched)
+
+                pending = [s.next_run for s in self.schedules if not s.running]
+
+            timeout = max(0.0, min(pending) - time.monotonic()) if pending else None
+            self._wakeup.wait(timeout)
+            self._wakeup.clear()
+
+    def stop(self):
+        self._stop.set()
+        self._wakeup.set()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, sched: ProviderSchedule):
+        provider = sched.provider
+        started = time.monotonic()
+        events: Optional[List[Event]] = None
+        try:
+            events = self.fetch(provider)
+        except Exception as e:
+            print(f"[Scheduler] {provider.name} falló: {e}")
+
+        ok = events is not None
+        try:
+            self.on_result(provider, events)
+        except Exception as e:
+            print(f"[Scheduler] Error publicando {provider.name}: {e}")
+
+        with self._lock:
+            if ok:
+                sched.failures = 0
+                sched.events = events
+            else:
+                sched.failures += 1
+
+            interval = self._next_interval(sched)
+            sched.next_run = time.monotonic() + interval
+            sched.running = False
+
+        elapsed = time.monotonic() - started
+        status = f"{len(events)} eventos" if ok else f"fallo #{sched.failures}"
+        print(f"[Scheduler] {provider.name}: {status} en {elapsed:.1f}s, próximo en {interval:.0f}s")
+        self._wakeup.set()
+
+    def _next_interval(self, sched: ProviderSchedule) -> float:
+        provider = sched.provider
+        if sched.failures:
+            base = min(provider.refresh_interval * 2 ** sched.failures, MAX_BACKOFF)
+        elif self._in_live_window(sched.events):
+            base = provider.live_interval
+        else:
+            base = provider.refresh_interval
+
+        jitter = random.uniform(-provider.refresh_jitter, provider.refresh_jitter)
+        return max(MIN_INTERVAL, base + jitter)
+
+    def _in_live_window(self, events: List[Event]) -> bool:
+        now_ms = time.time() * 1000
+        for e in events:
+            start = _start_ms(e, now_ms)
+            if start is not None and -LIVE_AFTER * 1000 <= start - now_ms <= LIVE_BEFORE * 1000:
+                return True
+        return False
+
+
+def _start_ms(event: Event, now_ms: float) -> Optional[float]:
+    """
+    Inicio del evento en ms. Si el provider no da start_time se usa su
+    match_time "HH:MM" (en UTC, como hace Tiroalpalo) en el día más cercano
+    a `now_ms`: un "23:30" visto a las 00:30 es el partido de ayer, en juego.
+    """
+    if event.start_time:
+        return event.start_time
+
+    m = CLOCK_RE.fullmatch(event.match_time or "")
+    if not m:
+        return None
+    hours, minutes = int(m.group(1)), int(m.group(2))
+    if hours > 23 or minutes > 59:
+        return None
+
+    today = now_ms - now_ms % DAY_MS + (hours * 60 + minutes) * 60 * 1000
+    return min((today - DAY_MS, today, today + DAY_MS), key=lambda t: abs(t - now_ms))
@@ -0,0 +1,120 @@
+"""
+Búsqueda y paginación de eventos en el servidor.
+
+El índice se construye una sola vez por snapshot (ver store.Snapshot):
+
+• Índice invertido: palabra normalizada (sin acentos, en minúsculas) de
+  equipos, liga, nombre y hora -> posiciones de los eventos que la contienen.
+• Vocabulario ordenado: cada término de la búsqueda se trata como prefijo
+  ("barc" encuentra "barcelona"); con bisect se localiza el rango de palabras
+  que empiezan por él sin recorrer todo el vocabulario.
+• Posiciones por provider y por liga para los filtros.
+
+Una consulta exige que todos los términos de `q` aparezcan (como prefijo de
+alguna palabra) en el evento y devuelve los eventos en el orden del snapshot.
+"""
+
+import math
+from bisect import bisect_left
+from typing import Dict, List, Optional, Set
+
+from .utils import normalize_text, tokenize
+
+# Campos del evento en los que se busca
+SEARCH_FIELDS = ("home", "away", "league", "name", "match_time")
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class SearchIndex:
+    def __init__(self, events: List[dict]):
+        self.events = events
+
+        self._postings: Dict[str, List[int]] = {}
+        self._by_provider: Dict[str, List[int]] = {}
+        self._by_league: Dict[str, List[int]] = {}
+
+        # Equipos y ligas se repiten mucho: cada texto se tokeniza una vez
+        tokens_of: Dict[str, List[str]] = {}
+
+        for pos, e in enumerate(events):
+            words: Set[str] = set()
+            for name in SEARCH_FIELDS:
+                value = e.get(name)
+                if not value:
+                    continue
+                value = str(value)
+                tokens = tokens_of.get(value)
+                if tokens is None:
+                    tokens = tokens_of[value] = tokenize(value)
+                words.update(tokens)
+
+            # Las posiciones se añaden en orden: cada lista queda ordenada
+            for word in words:
+                self._postings.setdefault(word, []).append(pos)
+
+            self._by_provider.setdefault(normalize_text(e.get("provider") or ""), []).append(pos)
+            self._by_league.setdefault(normalize_text(e.get("league") or ""), []).append(pos)
+
+        self._vocabulary: List[str] = sorted(self._postings)
+
+    def query(
+        self,
+        provider: Optional[str] = None,
+        league: Optional[str] = None,
+        q: Optional[str] = None,
+    ) -> List[dict]:
+        """Eventos que cumplen todos los filtros indicados (sin acentos ni mayúsculas)."""
+        # Un grupo por filtro: listas ordenadas de posiciones cuya unión lo cumple
+        groups: List[List[List[int]]] = []
+
+        if provider:
+            groups.append([self._by_provider.get(normalize_text(provider), [])])
+        if league:
+            groups.append([self._by_league.get(normalize_text(league), [])])
+        for term in set(tokenize(q or "")):
+            groups.append(self._prefix_postings(term))
+
+        if not groups:
+            return list(self.events)
+        if len(groups) == 1 and len(groups[0]) <= 1:
+            # Un solo filtro que es una sola lista: ya está en orden
+            positions = groups[0][0] if groups[0] else []
+            return [self.events[pos] for pos in positions]
+
+        # Intersección empezando por el grupo más pequeño
+        sets = sorted((set().union(*group) for group in groups), key=len)
+        matches = sets[0]
+        for positions in sets[1:]:
+            if not matches:
+                break
+            matches = matches & positions
+
+        return [self.events[pos] for pos in sorted(matches)]
+
+    def _prefix_postings(self, prefix: str) -> List[List[int]]:
+        """Listas de posiciones de las palabras que empiezan por `prefix`."""
+        vocabulary = self._vocabulary
+        i = bisect_left(vocabulary, prefix)
+
+        postings = []
+        while i < len(vocabulary) and vocabulary[i].startswith(prefix):
+            postings.append(self._postings[vocabulary[i]])
+            i += 1
+        return postings
+
+
+def paginate(items: List[dict], page: int = 1, page_size: int = DEFAULT_PAGE_SIZE) -> dict:
+    """Una página de `items` con los totales que necesita el cliente."""
+    page_size = min(max(1, page_size), MAX_PAGE_SIZE)
+    page = max(1, page)
+    start = (page - 1) * page_size
+
+    return {
+        "items": items[start:start + page_size],
+        "total": len(items),
+        "page": page,
+        "page_size": page_size,
+        "pages": max(1, math.ceil(len(items) / page_size)),
+    }
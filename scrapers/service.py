@@ -1,28 +1,82 @@
-from typing import List
-from .models import Event
+import asyncio
+from typing import List, Optional
+from .models import Event, merge_events
 from .base import BaseProvider
+from .http import shared_client
+
+# Tiempo máximo por provider y para el refresco completo (segundos)
+PROVIDER_TIMEOUT = 45
+GLOBAL_TIMEOUT = 60
+
 
 class ScraperService:
-    def __init__(self, providers: List[BaseProvider]):
+    def __init__(
+        self,
+        providers: List[BaseProvider],
+        concurrent: bool = True,
+        provider_timeout: float = PROVIDER_TIMEOUT,
+        global_timeout: float = GLOBAL_TIMEOUT,
+    ):
         self.providers = providers
+        self.concurrent = concurrent
+        self.provider_timeout = provider_timeout
+        self.global_timeout = global_timeout
 
     def build_events(self) -> List[Event]:
+        if self.concurrent:
+            # Todos los providers en el loop del cliente HTTP compartido
+            return shared_client().run(self.build_events_async())
+
+        return self.merge(self._run_sequential())
+
+    async def build_events_async(self) -> List[Event]:
+        """
+        Lanza todos los providers a la vez como tareas del mismo event loop.
+        Cada provider tiene su propio deadline (atributo `timeout` del provider
+        o `provider_timeout`) acotado por el deadline global; al vencer, su
+        tarea se cancela (con todas sus sub-descargas) y el provider no aporta
+        eventos. Por eso los providers que rastrean muchas páginas (KevinSport,
+        Tiroalpalo) cortan antes su rastreo (CRAWL_DEADLINE) y devuelven lo
+        ya hecho: este deadline es solo la última red. Conservar el último
+        resultado bueno es cosa de SegmentStore (con su max_age), no del
+        servicio.
+        """
+        results = await asyncio.gather(
+            *(self._fetch_with_deadline(p, self.global_timeout) for p in self.providers),
+            return_exceptions=True,
+        )
+
+        events = []
+        for p, result in zip(self.providers, results):
+            if isinstance(result, BaseException):
+                if isinstance(result, asyncio.TimeoutError):
+                    print(f"[ScraperService] {p.name} superó el tiempo límite")
+                result = None
+            events.extend(result or [])
+
+        return self.merge(events)
+
+    def fetch_provider(self, provider: BaseProvider) -> List[Event]:
+        """Ejecuta un único provider con su deadline (las excepciones se propagan)."""
+        return shared_client().run(self._fetch_with_deadline(provider))
+
+    async def _fetch_with_deadline(self, provider: BaseProvider, limit: Optional[float] = None) -> List[Event]:
+        timeout = getattr(provider, "timeout", None) or self.provider_timeout
+        if limit is not None:
+            timeout = min(timeout, limit)
+        return await asyncio.wait_for(provider.fetch_events_async(), timeout)
+
+    def _run_sequential(self) -> List[Event]:
         events = []
 
         for p in self.providers:
             try:
-                events.extend(p.fetch_events())
+                events.extend(p.fetch_events() or [])
             except Exception:
                 continue
 
-        # eliminar duplicados por id+liga
-        seen = set()
-        unique = []
-        for e in sorted(events, key=lambda x: x.start_time):
-            key = (e.id, e.league)
-            if key in seen:
-                continue
-            seen.add(key)
-            unique.append(e)
+        return events
 
-        return unique
+    def merge(self, events: List[Event]) -> List[Event]:
+        # eliminar duplicados por id+liga
+        return merge_events(events)
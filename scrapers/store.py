@@ -0,0 +1,348 @@
+"""
+Almacén en memoria del snapshot de eventos (cache/events.json).
+
+El worker publica el fichero; la web lo lee una sola vez por snapshot y
+sirve todas las peticiones desde memoria. Para detectar un snapshot nuevo
+solo se hace un os.stat() como mucho cada `check_interval` segundos.
+
+Los índices (por id, provider y liga, y el de búsqueda de /api/events) se
+construyen una vez por snapshot.
+
+Formato del fichero (publicado de forma atómica con publish_snapshot):
+    {"version": 1700000000000, "generated_at": 1700000000000, "events": [...]}
+También se acepta el formato antiguo (una lista de eventos).
+
+El worker mantiene además un segmento por provider (SegmentStore) y
+reconstruye events.json a partir de ellos.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+from .models import merge_events
+from .search import SearchIndex
+
+_publish_lock = threading.Lock()
+_last_version = 0
+
+# Antigüedad máxima de un segmento que se conserva tras fallos del provider
+SEGMENT_MAX_AGE = 6 * 60 * 60
+
+# Permisos de events.json y los segmentos si aún no existen
+SNAPSHOT_FILE_MODE = 0o644
+
+
+def _next_version() -> int:
+    """Versión creciente basada en milisegundos (llamar con _publish_lock)."""
+    global _last_version
+    _last_version = max(_last_version + 1, int(time.time() * 1000))
+    return _last_version
+
+
+def _atomic_write_json(path: str, payload: dict):
+    """Escribe en un temporal del mismo directorio y lo renombra sobre `path`."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+
+    # mkstemp crea el temporal con 0600 y os.replace conserva ese modo: se
+    # deja el del fichero anterior (o 0644) para que la web, aunque corra
+    # con otro usuario, pueda seguir leyéndolo
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except OSError:
+        mode = SNAPSHOT_FILE_MODE
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".json")
+    try:
+        os.chmod(tmp_path, mode)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def publish_snapshot(path: str, events: List[dict]) -> int:
+    """
+    Escribe el snapshot en un fichero temporal del mismo directorio y lo
+    renombra sobre `path`, así los lectores nunca ven un fichero a medias.
+    Devuelve la versión publicada (creciente, basada en milisegundos).
+    """
+    with _publish_lock:
+        version = _next_version()
+        payload = {"version": version, "generated_at": int(time.time() * 1000), "events": events}
+        _atomic_write_json(path, payload)
+
+    return version
+
+
+class SegmentStore:
+    """
+    Un segmento versionado por provider (cache/segments/<provider>.json).
+
+    • Un provider solo reescribe su segmento. Si el contenido no cambió
+      solo se renueva su `verified_at` (también en disco); la versión sigue
+      igual.
+    • El snapshot unido (events.json) se reconstruye únicamente cuando
+      cambia algún segmento.
+    • Si un provider falla se conserva su último segmento bueno, salvo que
+      lleve más de `max_age` segundos sin verificarse (para no servir eventos
+      caducados). La antigüedad sale de `verified_at`, así que sobrevive a un
+      reinicio del worker.
+    """
+
+    def __init__(self, directory: str, snapshot_path: str, max_age: float = SEGMENT_MAX_AGE):
+        self.directory = directory
+        self.snapshot_path = snapshot_path
+        self.max_age = max_age
+
+        self.segments: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def update(self, provider: str, events: List[dict]) -> bool:
+        """Guarda los eventos de un provider. Devuelve True si hubo cambios."""
+        fingerprint = hashlib.sha1(
+            json.dumps(events, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        ).hexdigest()
+
+        with self._lock:
+            current = self.segments.get(provider)
+            now_ms = int(time.time() * 1000)
+            if current and current.get("fingerprint") == fingerprint:
+                # Sin cambios: se guarda cuándo se verificó, sin publicar snapshot
+                current["verified_at"] = now_ms
+                _atomic_write_json(self._segment_path(provider), current)
+                return False
+
+            with _publish_lock:
+                version = _next_version()
+            segment = {
+                "provider": provider,
+                "version": version,
+                "updated_at": now_ms,
+                "verified_at": now_ms,
+                "fingerprint": fingerprint,
+                "events": events,
+            }
+            _atomic_write_json(self._segment_path(provider), segment)
+            self.segments[provider] = segment
+            self._publish_locked()
+            return True
+
+    def mark_failed(self, provider: str) -> bool:
+        """Conserva el último segmento bueno; lo descarta si está caducado."""
+        with self._lock:
+            current = self.segments.get(provider)
+            if not current:
+                return False
+
+            age = time.time() - self._verified_at(current) / 1000
+            if age <= self.max_age:
+                return False
+
+            print(f"[SegmentStore] Segmento de {provider} caducado ({age:.0f}s), se descarta")
+            del self.segments[provider]
+            try:
+                os.remove(self._segment_path(provider))
+            except OSError:
+                pass
+            self._publish_locked()
+            return True
+
+    def merged(self) -> List[dict]:
+        with self._lock:
+            return merge_events([e for seg in self.segments.values() for e in seg["events"]])
+
+    def _publish_locked(self) -> int:
+        events = merge_events([e for seg in self.segments.values() for e in seg["events"]])
+        return publish_snapshot(self.snapshot_path, events)
+
+    @staticmethod
+    def _verified_at(segment: dict) -> int:
+        # Los segmentos escritos antes de existir verified_at solo tienen updated_at
+        return segment.get("verified_at") or segment.get("updated_at", 0)
+
+    def _segment_path(self, provider: str) -> str:
+        safe = "".join(c if c.isalnum() else "_" for c in provider.lower())
+        return os.path.join(self.directory, f"{safe}.json")
+
+    def _load(self):
+        """Recupera los segmentos publicados antes de reiniciar el worker."""
+        if not os.path.isdir(self.directory):
+            return
+
+        for filename in os.listdir(self.directory):
+            if not filename.endswith(".json") or filename.startswith(".tmp-"):
+                continue
+            try:
+                with open(os.path.join(self.directory, filename), "r", encoding="utf-8") as f:
+                    segment = json.load(f)
+                self.segments[segment["provider"]] = segment
+            except Exception as e:
+                print(f"[SegmentStore] Segmento ilegible {filename}: {e}")
+
+
+class Snapshot:
+    """Eventos de un snapshot más sus índices precalculados."""
+
+    def __init__(self, events: List[dict], version: int = 0):
+        self.events = events
+        self.version = version
+
+        self.by_id: Dict[str, dict] = {}
+        self.by_provider: Dict[str, List[dict]] = {}
+        self.by_league: Dict[str, List[dict]] = {}
+
+        for e in events:
+            # Si hay ids repetidos (misma id en varias ligas) gana el primero,
+            # igual que el antiguo next(...) sobre la lista
+            self.by_id.setdefault(str(e.get("id")), e)
+            self.by_provider.setdefault(e.get("provider") or "", []).append(e)
+            self.by_league.setdefault(e.get("league") or "", []).append(e)
+
+        self.search = SearchIndex(events)
+
+    def find(self, event_id) -> Optional[dict]:
+        return self.by_id.get(str(event_id))
+
+
+class EventStore:
+    def __init__(self, path: str, check_interval: float = 2.0):
+        self.path = path
+        self.check_interval = check_interval
+
+        self._snapshot = Snapshot([])
+        self._signature: Optional[tuple] = None
+        self._checked_at = float("-inf")  # la primera lectura siempre comprueba
+        self._lock = threading.Lock()
+
+    @property
+    def events(self) -> List[dict]:
+        return self._snapshot.events
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    def current(self) -> Snapshot:
+        """Devuelve el último snapshot publicado (con sus índices)."""
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return self._snapshot
+
+        with self._lock:
+            if now - self._checked_at >= self.check_interval:
+                self._refresh()
+                self._checked_at = time.monotonic()
+
+        return self._snapshot
+
+    def get(self) -> List[dict]:
+        """Devuelve los eventos del último snapshot publicado."""
+        return self.current().events
+
+    def find(self, event_id) -> Optional[dict]:
+        """Busca un evento por id en O(1)."""
+        return self.current().find(event_id)
+
+    def invalidate(self):
+        """Fuerza a comprobar el fichero en la siguiente lectura."""
+        self._checked_at = float("-inf")
+
+    def _refresh(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return
+
+        # inodo + mtime + tamaño identifican el snapshot publicado (os.replace cambia el inodo)
+        signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if signature == self._signature:
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            # Fichero corrupto o ilegible: se reintenta en la próxima comprobación
+            print(f"[EventStore] Error leyendo {self.path}: {e}")
+            return
+
+        if isinstance(data, dict):
+            events = data.get("events") or []
+            version = data.get("version") or self._snapshot.version + 1
+        else:
+            # Formato antiguo: lista de eventos sin versión
+            events = data if isinstance(data, list) else []
+            version = self._snapshot.version + 1
+
+        # Se sustituye el snapshot entero: los lectores nunca ven índices a medias
+        self._snapshot = Snapshot(events, version)
+        self._signature = signature
+
+
+class SnapshotRefresher:
+    """
+    Refresco en segundo plano para el arranque en frío.
+
+    Como mucho hay un refresco en curso: las peticiones que llegan mientras
+    tanto esperan al mismo (con timeout) en lugar de lanzar su propio
+    scraping. Tras terminar, no se lanza otro hasta pasado `cooldown`.
+    """
+
+    def __init__(self, store: EventStore, refresh_fn, cooldown: float = 60.0):
+        self.store = store
+        self.refresh_fn = refresh_fn
+        self.cooldown = cooldown
+
+        self._lock = threading.Lock()
+        self._done: Optional[threading.Event] = None
+        self._finished_at: Optional[float] = None
+
+    def trigger(self) -> Optional[threading.Event]:
+        """Lanza el refresco si no hay uno en curso; devuelve el evento de fin."""
+        with self._lock:
+            if self._done is not None and not self._done.is_set():
+                return self._done
+
+            if (self._finished_at is not None
+                    and time.monotonic() - self._finished_at < self.cooldown):
+                return None
+
+            done = threading.Event()
+            self._done = done
+
+        threading.Thread(
+            target=self._run, args=(done,), name="snapshot-refresh", daemon=True
+        ).start()
+        return done
+
+    def trigger_and_wait(self, timeout: float) -> bool:
+        """Lanza (o reutiliza) el refresco y espera como mucho `timeout` segundos."""
+        done = self.trigger()
+        if done is None:
+            return False
+        return done.wait(timeout)
+
+    def _run(self, done: threading.Event):
+        try:
+            self.refresh_fn()
+        except Exception as e:
+            print(f"[SnapshotRefresher] Error refrescando snapshot: {e}")
+        finally:
+            self.store.invalidate()
+            with self._lock:
+                self._finished_at = time.monotonic()
+            done.set()
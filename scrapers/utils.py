@@ -0,0 +1,92 @@
+"""
+Utilidades de texto y urls compartidas por los providers.
+
+Se ejecutan por cada evento / enlace de cada página, así que las expresiones
+regulares se compilan una sola vez al importar y los casos comunes se
+resuelven con operaciones de str (startswith, in, split) sin crear objetos
+intermedios.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+# Separadores habituales entre equipos, en orden de preferencia
+TEAM_SEPARATORS = (" – ", " - ", " vs ", " Vs ", " v ")
+
+ROOT_RE = re.compile(r"https?://[^/]+")
+# "Home VS Away" con cualquier mayúscula y espaciado
+VS_RE = re.compile(r"\s+vs\s+", re.IGNORECASE)
+# "23:30 | Home vs Away" / "23:30 - Home vs Away"
+TIME_PREFIX_RE = re.compile(r"(\d{1,2}:\d{2})\s*[|\-]?(.*)")
+# Texto entre paréntesis: "23:30 (Brazil. Serie A)"
+PARENS_RE = re.compile(r"\((.*?)\)")
+# Palabras para el índice de búsqueda ("Flamengo-RJ" -> flamengo, rj)
+TOKEN_RE = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=1024)
+def site_root(url: str) -> Optional[str]:
+    """'https://host/ruta' -> 'https://host' (None si no es absoluta)."""
+    m = ROOT_RE.match(url)
+    return m.group(0) if m else None
+
+
+def absolute_url(url: str, base: str) -> str:
+    """
+    Convierte urls relativas o //cdn en absolutas respecto a `base`
+    (una url de la página o directamente la raíz del sitio).
+    """
+    if url.startswith(("http://", "https://")):
+        return url
+    if url.startswith("//"):
+        return "https:" + url
+
+    root = site_root(base) or base.rstrip("/")
+    if url.startswith("/"):
+        return root + url
+    return root + "/" + url
+
+
+def split_teams(title: str, separators: Sequence[str] = TEAM_SEPARATORS) -> Tuple[str, str]:
+    """Divide 'Home – Away' en (home, away) con el primer separador presente."""
+    for sep in separators:
+        if sep in title:
+            home, away = title.split(sep, 1)
+            return home.strip(), away.strip()
+    return title.strip(), ""
+
+
+def split_time_prefix(title: str) -> Tuple[Optional[str], str]:
+    """'23:30 | Home vs Away' -> ('23:30', 'Home vs Away')."""
+    m = TIME_PREFIX_RE.match(title)
+    if not m:
+        return None, title
+    return m.group(1), m.group(2).strip()
+
+
+def text_in_parens(text: str) -> str:
+    """Primer texto entre paréntesis, o "" si no hay."""
+    if "(" not in text:
+        return ""
+    m = PARENS_RE.search(text)
+    return m.group(1).strip() if m else ""
+
+
+def fold_accents(text: str) -> str:
+    """'Atlético München' -> 'Atletico Munchen'."""
+    if text.isascii():
+        return text
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def normalize_text(text: str) -> str:
+    """Texto para comparar en búsquedas: sin acentos, minúsculas y espacios simples."""
+    return " ".join(fold_accents(text).casefold().split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Palabras normalizadas de `text`."""
+    return TOKEN_RE.findall(normalize_text(text))
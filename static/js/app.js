@@ -1,64 +1,173 @@
 // Filtros + paginación por proveedor
+// La página trae solo la primera página de cada proveedor; las demás páginas
+// y las búsquedas se piden a /api/events (filtrado y paginación en el servidor).
 (function () {
   const searchInput = document.getElementById("searchInput");
   const providerFilter = document.getElementById("providerFilter");
 
-  // Inicializar paginación por proveedor
-  document.querySelectorAll(".provider-block").forEach(block => {
-    const table = block.querySelector(".provider-table");
-    if (!table) return;
+  // Espera tras la última tecla antes de buscar (ms)
+  const SEARCH_DELAY = 250;
 
-    const rows = Array.from(table.querySelectorAll("tbody tr"));
-    const pageSize = parseInt(table.dataset.pageSize || "10", 10);
+  let currentTerm = "";
+
+  // ---------- Render de filas (mismo marcado que templates/index.html) ----------
+  function formatDate(ts) {
+    const value = parseInt(ts, 10);
+    if (!value) return "Hoy";
+    const date = new Date(value);
+    if (isNaN(date.getTime())) return "Hoy";
+    // Igual que el filtro datetime: UTC "YYYY-MM-DD HH:MM:SS"
+    return date.toISOString().slice(0, 19).replace("T", " ");
+  }
+
+  function el(tag, className, text) {
+    const node = document.createElement(tag);
+    if (className) node.className = className;
+    if (text !== undefined) node.textContent = text;
+    return node;
+  }
+
+  function streamLink(event, provider) {
+    const enc = encodeURIComponent;
+    // Para LiveTV SIEMPRE debe ser lazy
+    if (provider.toLowerCase() === "livetv") {
+      return `/stream?event=${enc(event.id)}&source=LiveTV`;
+    }
+    if (event.streams && event.streams.length > 0) {
+      return `/stream?url=${enc(event.streams[0].url)}&source=${enc(event.provider)}&event=${enc(event.id)}`;
+    }
+    return null;
+  }
+
+  function renderRow(event, provider) {
+    const tr = document.createElement("tr");
+
+    // FECHA/HORA
+    const timeTd = el("td");
+    const badge = el("span", "badge", event.match_time || event.date_text || formatDate(event.start_time));
+    badge.style.background = "var(--accent-color)";
+    badge.style.fontSize = "0.9rem";
+    timeTd.appendChild(badge);
+    tr.appendChild(timeTd);
+
+    // PARTIDO
+    const matchTd = el("td");
+    matchTd.appendChild(el("strong", "", event.home));
+    if (event.away) {
+      matchTd.appendChild(el("span", "text-danger mx-2", "vs"));
+      matchTd.appendChild(el("strong", "", event.away));
+    }
+    tr.appendChild(matchTd);
+
+    // LIGA
+    const leagueTd = el("td");
+    leagueTd.appendChild(el("span", "text-muted small", event.league || "Sin información"));
+    tr.appendChild(leagueTd);
+
+    // BOTÓN VER STREAM
+    const actionTd = el("td", "text-end");
+    const href = streamLink(event, provider);
+    if (href) {
+      const a = el("a", "btn btn-primary btn-sm", "Ver transmisión");
+      a.href = href;
+      actionTd.appendChild(a);
+    }
+    tr.appendChild(actionTd);
+
+    return tr;
+  }
+
+  function renderRows(block, items) {
+    const tbody = block.querySelector(".provider-table tbody");
+    const provider = block.dataset.provider || "";
+
+    tbody.replaceChildren();
+    if (!items.length) {
+      const tr = document.createElement("tr");
+      const td = el("td", "text-center text-muted", "Sin resultados");
+      td.colSpan = 4;
+      tr.appendChild(td);
+      tbody.appendChild(tr);
+      return;
+    }
+    items.forEach(event => tbody.appendChild(renderRow(event, provider)));
+  }
+
+  // ---------- Paginación por proveedor ----------
+  function setupBlock(block) {
+    const table = block.querySelector(".provider-table");
     const controls = block.querySelector(".pagination-controls");
-    if (!rows.length || !controls) return;
+    if (!table || !controls) return;
 
-    const prevBtn = controls.querySelector(".prev-page");
-    const nextBtn = controls.querySelector(".next-page");
-    const pageInfo = controls.querySelector(".page-info");
+    const pageSize = parseInt(table.dataset.pageSize || "10", 10);
+    const total = parseInt(block.dataset.total || "0", 10);
 
     const state = {
-      rows,
       pageSize,
       currentPage: 1,
-      totalPages: Math.max(1, Math.ceil(rows.length / pageSize)),
+      totalPages: Math.max(1, Math.ceil(total / pageSize)),
+      term: "",          // búsqueda con la que se cargaron las filas actuales
+      controller: null,  // petición en curso (se cancela si llega otra)
     };
 
-    function renderPage() {
-      const { rows, pageSize, currentPage } = state;
-
-      rows.forEach((row, idx) => {
-        const pageIndex = Math.floor(idx / pageSize) + 1;
-        row.style.display = pageIndex === currentPage ? "" : "none";
-      });
+    const prevBtn = controls.querySelector(".prev-page");
+    const nextBtn = controls.querySelector(".next-page");
+    const pageInfo = controls.querySelector(".page-info");
+    const count = block.querySelector(".match-count");
 
+    function renderControls() {
       pageInfo.textContent = `Página ${state.currentPage} de ${state.totalPages}`;
       prevBtn.disabled = state.currentPage === 1;
       nextBtn.disabled = state.currentPage === state.totalPages;
     }
 
+    function loadPage(page) {
+      if (state.controller) state.controller.abort();
+      state.controller = new AbortController();
+
+      const term = currentTerm;
+      const params = new URLSearchParams({
+        provider: block.dataset.provider || "",
+        page: String(page),
+        page_size: String(pageSize),
+      });
+      if (term) params.set("q", term);
+
+      fetch(`/api/events?${params}`, { signal: state.controller.signal })
+        .then(resp => {
+          if (!resp.ok) throw new Error(`HTTP ${resp.status}`);
+          return resp.json();
+        })
+        .then(data => {
+          renderRows(block, data.items);
+          state.currentPage = data.page;
+          state.totalPages = data.pages;
+          state.term = term;
+          if (count) count.textContent = `${data.total} partidos`;
+          renderControls();
+        })
+        .catch(err => {
+          if (err.name !== "AbortError") console.error("Error cargando eventos:", err);
+        });
+    }
+
     prevBtn.addEventListener("click", () => {
-      if (state.currentPage > 1) {
-        state.currentPage -= 1;
-        renderPage();
-      }
+      if (state.currentPage > 1) loadPage(state.currentPage - 1);
     });
 
     nextBtn.addEventListener("click", () => {
-      if (state.currentPage < state.totalPages) {
-        state.currentPage += 1;
-        renderPage();
-      }
+      if (state.currentPage < state.totalPages) loadPage(state.currentPage + 1);
     });
 
     // Guardar referencia
-    block._pagination = { state, renderPage, controls };
-    renderPage();
-  });
+    block._pagination = { state, loadPage };
+    renderControls();
+  }
+
+  document.querySelectorAll(".provider-block").forEach(setupBlock);
 
-  // Filtro principal (búsqueda + proveedor)
+  // ---------- Filtro principal (búsqueda + proveedor) ----------
   function applyFilters() {
-    const term = (searchInput?.value || "").toLowerCase().trim();
     const selectedProvider = providerFilter?.value || "";
 
     document.querySelectorAll(".provider-block").forEach(block => {
@@ -69,35 +178,21 @@
       block.style.display = matchProvider ? "" : "none";
       if (!matchProvider) return;
 
-      const rows = Array.from(block.querySelectorAll("tbody tr"));
+      // Solo se piden al servidor los bloques visibles cuya búsqueda cambió
       const pagination = block._pagination;
-
-      // -------------- SIN BÚSQUEDA --------------
-      if (!term) {
-        rows.forEach(r => (r.style.display = "")); // reset
-
-        if (pagination) {
-          pagination.controls.style.display = "flex"; // mostrar paginación normal
-          pagination.state.totalPages = Math.max(1, Math.ceil(rows.length / pagination.state.pageSize));
-          pagination.state.currentPage = 1;
-          pagination.renderPage();
-        }
-        return;
-      }
-
-      // -------------- CON BÚSQUEDA --------------
-      rows.forEach(r => {
-        const text = r.innerText.toLowerCase();
-        r.style.display = text.includes(term) ? "" : "none";
-      });
-
-      // ocultar completamente la paginación
-      if (pagination) {
-        pagination.controls.style.display = "none";
+      if (pagination && pagination.state.term !== currentTerm) {
+        pagination.loadPage(1);
       }
     });
   }
 
-  searchInput?.addEventListener("input", applyFilters);
+  let searchTimer = null;
+  searchInput?.addEventListener("input", () => {
+    clearTimeout(searchTimer);
+    searchTimer = setTimeout(() => {
+      currentTerm = (searchInput.value || "").trim();
+      applyFilters();
+    }, SEARCH_DELAY);
+  });
   providerFilter?.addEventListener("change", applyFilters);
 })();
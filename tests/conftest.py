@@ -0,0 +1,38 @@
+import pytest
+
+from scrapers.models import Event
+
+
+def _make_event(
+    event_id,
+    home=None,
+    away="Rival",
+    league="Liga",
+    provider="LiveTV",
+    start_time=0,
+    match_time="",
+) -> Event:
+    home = f"Home {event_id}" if home is None else home
+    return Event(
+        id=event_id,
+        name=f"{home} vs {away}",
+        url=f"https://example.com/{event_id}",
+        league=league,
+        home=home,
+        away=away,
+        start_time=start_time,
+        provider=provider,
+        match_time=match_time,
+    )
+
+
+@pytest.fixture
+def make_event():
+    """Fábrica de Event; lo que el test no fija toma un valor por defecto."""
+    return _make_event
+
+
+@pytest.fixture
+def event_dict():
+    """Como make_event, pero en el formato dict del snapshot (asdict)."""
+    return lambda *args, **kwargs: _make_event(*args, **kwargs).to_dict()
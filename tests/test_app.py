@@ -0,0 +1,56 @@
+import gzip
+import json
+
+import pytest
+
+import app as app_module
+from scrapers.store import EventStore, publish_snapshot
+
+
+@pytest.fixture
+def events(event_dict):
+    return [event_dict(str(i), "Barcelona" if i % 3 == 0 else f"Equipo {i}") for i in range(30)]
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch, events):
+    path = str(tmp_path / "events.json")
+    publish_snapshot(path, events)
+    monkeypatch.setattr(app_module, "event_store", EventStore(path, check_interval=0))
+    for cache in (app_module.index_page, app_module.events_api, app_module.events_query_api):
+        cache.clear()
+    return app_module.app.test_client()
+
+
+def _json(resp):
+    data = resp.get_data()
+    if resp.headers.get("Content-Encoding") == "gzip":
+        data = gzip.decompress(data)
+    return json.loads(data)
+
+
+def test_full_list_matches_jsonify(client, events):
+    resp = client.get("/api/events")
+
+    with app_module.app.app_context():
+        expected = app_module.app.json.response(events).get_data()
+    assert resp.status_code == 200
+    assert resp.get_data() == expected
+
+
+def test_query_is_filtered_and_paginated(client):
+    resp = client.get("/api/events?q=barc&page=2&page_size=4", headers={"Accept-Encoding": "gzip"})
+
+    data = _json(resp)
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert data["total"] == 10
+    assert data["pages"] == 3
+    assert [e["id"] for e in data["items"]] == ["12", "15", "18", "21"]
+
+
+def test_equivalent_queries_share_etag_and_revalidate(client):
+    first = client.get("/api/events?provider=LiveTV&q=Barc")
+    second = client.get("/api/events?provider=livetv%20&q=barc", headers={"If-None-Match": first.headers["ETag"]})
+
+    assert second.status_code == 304
+    assert second.headers["ETag"] == first.headers["ETag"]
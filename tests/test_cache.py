@@ -0,0 +1,132 @@
+import threading
+import time
+
+import pytest
+
+from scrapers import cache as cache_module
+from scrapers.cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Reloj controlable para time.monotonic() dentro de scrapers.cache."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_get_set_and_expiry(clock):
+    cache = TTLCache(ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=60)
+
+    clock[0] += 9
+    assert cache.get("a") == 1
+
+    clock[0] += 2
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert len(cache) == 1
+
+
+def test_lru_eviction():
+    cache = TTLCache(ttl=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "a" pasa a ser la más reciente
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_get_or_load_caches_value():
+    cache = TTLCache(ttl=60)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return "value"
+
+    assert cache.get_or_load("k", loader) == "value"
+    assert cache.get_or_load("k", loader) == "value"
+    assert len(calls) == 1
+
+
+def test_get_or_load_does_not_cache_none():
+    cache = TTLCache(ttl=60)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return None
+
+    assert cache.get_or_load("k", loader) is None
+    assert cache.get_or_load("k", loader) is None
+    assert len(calls) == 2
+
+
+def test_get_or_load_coalesces_concurrent_loads():
+    cache = TTLCache(ttl=60)
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def loader():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "shared"
+
+    results = []
+
+    def worker():
+        results.append(cache.get_or_load("k", loader))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    threads[0].start()
+    assert started.wait(5)
+    for t in threads[1:]:
+        t.start()
+    # Dejar que los demás hilos lleguen a esperar la carga en curso
+    time.sleep(0.05)
+    release.set()
+    for t in threads:
+        t.join(5)
+
+    assert calls == [1]
+    assert results == ["shared"] * 8
+
+
+def test_get_or_load_propagates_errors_to_waiters_and_retries():
+    cache = TTLCache(ttl=60)
+    started = threading.Event()
+    release = threading.Event()
+
+    def failing():
+        started.set()
+        release.wait(5)
+        raise ValueError("boom")
+
+    errors = []
+
+    def worker():
+        try:
+            cache.get_or_load("k", failing)
+        except ValueError as e:
+            errors.append(str(e))
+
+    leader = threading.Thread(target=worker)
+    leader.start()
+    assert started.wait(5)
+    follower = threading.Thread(target=worker)
+    follower.start()
+    time.sleep(0.05)
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert errors == ["boom", "boom"]
+    # El error no se cachea: la siguiente llamada vuelve a cargar
+    assert cache.get_or_load("k", lambda: "ok") == "ok"
@@ -0,0 +1,131 @@
+import json
+
+import pytest
+
+from benchmarks.replay import ReplayClient
+from scrapers.http import ConditionalCache
+from scrapers.providers.kakarotfoot import KakarotfootProvider
+
+URL = "https://example.com/list"
+
+
+def test_no_validators_before_first_response():
+    assert ConditionalCache().request_headers(URL) == {}
+
+
+def test_stores_validators_and_reports_changes():
+    cache = ConditionalCache()
+    headers = {"ETag": '"abc"', "Last-Modified": "Sat, 17 Oct 2026 10:00:00 GMT"}
+
+    assert cache.update(URL, 200, headers, b"body") is True
+    assert cache.request_headers(URL) == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Sat, 17 Oct 2026 10:00:00 GMT",
+    }
+
+
+def test_same_body_is_unchanged_without_validators():
+    cache = ConditionalCache()
+
+    assert cache.update(URL, 200, {}, b"body") is True
+    assert cache.update(URL, 200, {}, b"body") is False
+    assert cache.update(URL, 200, {}, b"other") is True
+    assert cache.request_headers(URL) == {}
+
+
+def test_not_modified_is_unchanged():
+    cache = ConditionalCache()
+    cache.update(URL, 200, {"ETag": '"abc"'}, b"body")
+
+    assert cache.update(URL, 304, {}, b"") is False
+    # Un 304 no borra los validadores guardados
+    assert cache.request_headers(URL) == {"If-None-Match": '"abc"'}
+
+
+def test_forget_makes_next_response_count_as_changed():
+    cache = ConditionalCache()
+    cache.update(URL, 200, {"ETag": '"abc"'}, b"body")
+
+    cache.forget(URL)
+
+    assert cache.request_headers(URL) == {}
+    assert cache.update(URL, 200, {"ETag": '"abc"'}, b"body") is True
+
+
+def test_is_changed_does_not_record():
+    cache = ConditionalCache()
+
+    assert cache.is_changed(URL, 200, b"body") is True
+    assert cache.is_changed(URL, 200, b"body") is True
+    cache.update(URL, 200, {}, b"body")
+    assert cache.is_changed(URL, 200, b"body") is False
+    assert cache.is_changed(URL, 304, b"") is False
+
+
+def test_urls_are_independent():
+    cache = ConditionalCache()
+    cache.update(URL, 200, {}, b"body")
+
+    assert cache.update(URL + "?page=2", 200, {}, b"body") is True
+
+
+def test_provider_reparses_feed_after_failed_parse():
+    feed = KakarotfootProvider.FEED
+    broken = json.dumps([{"home": "A", "away": "B", "url": "/a"}]).encode()
+    site = {feed: ("application/json", broken)}
+
+    client = ReplayClient(site)
+    provider = KakarotfootProvider()
+    provider.http = client
+    try:
+        # Mismo cuerpo roto dos veces: la segunda no puede darse por "sin cambios"
+        for _ in range(2):
+            with pytest.raises(KeyError):
+                client.run(provider.fetch_events_async())
+
+        fixed = json.dumps([{"id": 1, "home": "A", "away": "B", "url": "/a"}]).encode()
+        site[feed] = ("application/json", fixed)
+        events = client.run(provider.fetch_events_async())
+    finally:
+        client.close()
+
+    assert [e.id for e in events] == [1]
+
+
+def test_fetch_parsed_reuses_previous_result_while_unchanged():
+    site = {URL: ("text/plain", b"v1")}
+    parsed = []
+
+    def parse(resp):
+        parsed.append(resp.content)
+        return resp.content.decode()
+
+    client = ReplayClient(site)
+    try:
+        first = client.run(client.fetch_parsed(URL, parse))
+        again = client.run(client.fetch_parsed(URL, parse, first))
+        # Sin resultado anterior se parsea aunque la huella coincida
+        forced = client.run(client.fetch_parsed(URL, parse))
+
+        site[URL] = ("text/plain", b"v2")
+        changed = client.run(client.fetch_parsed(URL, parse, first))
+    finally:
+        client.close()
+
+    assert (first, again, forced, changed) == ("v1", "v1", "v1", "v2")
+    assert parsed == [b"v1", b"v1", b"v2"]
+
+
+def test_fetch_parsed_records_nothing_when_parse_fails():
+    site = {URL: ("text/plain", b"body")}
+
+    def broken(resp):
+        raise ValueError("roto")
+
+    client = ReplayClient(site)
+    try:
+        with pytest.raises(ValueError):
+            client.run(client.fetch_parsed(URL, broken, "anterior"))
+        assert client.conditional.is_changed(URL, 200, b"body") is True
+    finally:
+        client.close()
@@ -0,0 +1,93 @@
+import asyncio
+import time
+
+import pytest
+
+from benchmarks.fixtures import synthetic_site
+from benchmarks.replay import ReplayClient
+from scrapers import incremental as incremental_module
+from scrapers.incremental import EMPTY_REVALIDATE_INTERVAL, IncrementalTracker
+from scrapers.providers.kevinsport import KevinsportProvider
+from scrapers.providers.tiroalpalo import TiroalpaloProvider
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(incremental_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_new_rows_are_fetched():
+    tracker = IncrementalTracker(revalidate_interval=900)
+
+    to_fetch, reused = tracker.plan({"a": "sig-a", "b": "sig-b"})
+
+    assert sorted(to_fetch) == ["a", "b"]
+    assert reused == {}
+
+
+def test_unchanged_rows_are_reused_until_revalidation(clock):
+    tracker = IncrementalTracker(revalidate_interval=900)
+    tracker.record("a", "sig-a", "event-a")
+
+    clock[0] += 899
+    assert tracker.plan({"a": "sig-a"}) == ([], {"a": "event-a"})
+
+    clock[0] += 2
+    assert tracker.plan({"a": "sig-a"}) == (["a"], {})
+
+
+def test_changed_signature_is_fetched_again():
+    tracker = IncrementalTracker()
+    tracker.record("a", "sig-a", "event-a")
+
+    assert tracker.plan({"a": "sig-a2"}) == (["a"], {})
+
+
+def test_rows_gone_from_schedule_are_forgotten():
+    tracker = IncrementalTracker()
+    tracker.record("a", "sig-a", "event-a")
+
+    tracker.plan({"b": "sig-b"})
+
+    assert tracker.plan({"a": "sig-a"}) == (["a"], {})
+
+
+def test_empty_results_use_shorter_interval(clock):
+    tracker = IncrementalTracker(revalidate_interval=900)
+    tracker.record("empty", "sig", None, EMPTY_REVALIDATE_INTERVAL)
+    tracker.record("full", "sig", "event")
+
+    clock[0] += EMPTY_REVALIDATE_INTERVAL + 1
+    to_fetch, reused = tracker.plan({"empty": "sig", "full": "sig"})
+
+    assert to_fetch == ["empty"]
+    assert reused == {"full": "event"}
+
+
+@pytest.mark.parametrize("provider_cls", [KevinsportProvider, TiroalpaloProvider])
+def test_pages_crawled_before_deadline_are_reused(provider_cls):
+    site = synthetic_site()
+
+    def crawl(provider, client, timeout=None):
+        provider.http = client
+        before = client.requests
+        client.run(asyncio.wait_for(provider.fetch_events_async(), timeout))
+        return client.requests - before
+
+    client = ReplayClient(site, latency=0.005)
+    try:
+        started = time.monotonic()
+        full = crawl(provider_cls(max_in_flight=4), client)
+        elapsed = time.monotonic() - started
+
+        # Deadline a mitad del rastreo: lo terminado queda en el tracker
+        provider = provider_cls(max_in_flight=4)
+        with pytest.raises(asyncio.TimeoutError):
+            crawl(provider, client, timeout=elapsed / 2)
+        resumed = crawl(provider, client)
+    finally:
+        client.close()
+
+    assert resumed < full
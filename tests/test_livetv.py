@@ -0,0 +1,85 @@
+import asyncio
+import threading
+
+import pytest
+
+from benchmarks.fixtures import synthetic_site
+from benchmarks.replay import ReplayClient
+from scrapers.providers import livetv as livetv_module
+from scrapers.providers.livetv import LiveTVProvider
+
+
+@pytest.fixture
+def site():
+    return synthetic_site()
+
+
+@pytest.fixture
+def provider(site):
+    """LiveTV sobre respuestas grabadas, anotando cada url descargada."""
+    client = ReplayClient(site, latency=0.05)
+    fetch = client.fetch
+    client.fetched = []
+
+    async def counting_fetch(url, *args, **kwargs):
+        client.fetched.append(url)
+        return await fetch(url, *args, **kwargs)
+
+    client.fetch = counting_fetch
+    provider = LiveTVProvider()
+    provider.http = client
+    livetv_module._streams_cache.clear()
+    yield provider
+    livetv_module._streams_cache.clear()
+    client.close()
+
+
+@pytest.fixture
+def event_url(site):
+    return next(url for url in site if "/eventinfo/" in url)
+
+
+def test_concurrent_async_loads_share_one_scrape(provider, event_url):
+    async def many():
+        return await asyncio.gather(*(provider.load_streams_async(event_url) for _ in range(5)))
+
+    results = provider.http.run(many())
+
+    assert results[0]
+    assert all(r == results[0] for r in results)
+    assert provider.http.fetched.count(event_url) == 1
+
+
+def test_sync_loads_from_threads_share_one_scrape(provider, event_url):
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(provider.load_streams(event_url)))
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(10)
+
+    assert len(results) == 5 and results[0]
+    assert all(r == results[0] for r in results)
+    # Después, desde la caché
+    assert provider.load_streams(event_url) == results[0]
+    assert provider.http.fetched.count(event_url) == 1
+
+
+def test_load_from_another_loop_runs_on_client_loop(provider, event_url):
+    streams = asyncio.run(provider.load_streams_async(event_url))
+
+    assert streams
+    assert provider.load_streams(event_url) == streams
+    assert provider.http.fetched.count(event_url) == 1
+
+
+def test_timed_out_viewer_does_not_cancel_shared_scrape(provider, event_url, monkeypatch):
+    monkeypatch.setattr(livetv_module, "LOAD_STREAMS_TIMEOUT", 0.01)
+    assert provider.load_streams(event_url) == []
+
+    monkeypatch.setattr(livetv_module, "LOAD_STREAMS_TIMEOUT", 10)
+    assert provider.load_streams(event_url)
+    assert provider.http.fetched.count(event_url) == 1
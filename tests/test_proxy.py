@@ -0,0 +1,137 @@
+from urllib.parse import unquote
+
+import pytest
+
+import proxy
+from proxy import PROXY_PATH, proxied_url, proxy_response, rewrite_playlist
+
+BASE = "https://cdn.example.com/live/master.m3u8"
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, body=b"", url=None, headers=None):
+        self.status_code = status_code
+        self.content = body
+        self.text = body.decode()
+        self.url = url
+        self.headers = headers or {}
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Origen simulado: url -> FakeResponse, contando las peticiones."""
+    responses = {}
+    calls = []
+
+    def get(url, **kwargs):
+        calls.append(url)
+        resp = responses[url]
+        resp.url = resp.url or url
+        return resp
+
+    monkeypatch.setattr(proxy.session, "get", get)
+    proxy._playlist_cache.clear()
+    proxy._segment_cache.clear()
+    yield responses, calls
+    proxy._playlist_cache.clear()
+    proxy._segment_cache.clear()
+
+
+def _targets(playlist):
+    """urls de origen de cada línea reescrita (las que pasan por /proxy)."""
+    return [
+        unquote(line[len(PROXY_PATH):])
+        for line in playlist.splitlines()
+        if line.startswith(PROXY_PATH)
+    ]
+
+
+# ---------- rewrite_playlist ----------
+def test_rewrite_resolves_relative_and_absolute_uris():
+    text = "\n".join([
+        "#EXTM3U",
+        "#EXT-X-STREAM-INF:BANDWIDTH=800000",
+        "low/index.m3u8",
+        "#EXT-X-STREAM-INF:BANDWIDTH=1600000",
+        "/other/high.m3u8",
+        "#EXT-X-STREAM-INF:BANDWIDTH=3200000",
+        "https://mirror.example.org/hd.m3u8",
+    ])
+
+    assert _targets(rewrite_playlist(text, BASE)) == [
+        "https://cdn.example.com/live/low/index.m3u8",
+        "https://cdn.example.com/other/high.m3u8",
+        "https://mirror.example.org/hd.m3u8",
+    ]
+
+
+def test_rewrite_uri_attributes_and_keeps_other_tags():
+    text = "\n".join([
+        "#EXTM3U",
+        '#EXT-X-KEY:METHOD=AES-128,URI="key.bin",IV=0x1',
+        '#EXT-X-MAP:URI="https://cdn.example.com/init.mp4"',
+        "#EXTINF:4.0,",
+        "seg1.ts",
+    ])
+
+    lines = rewrite_playlist(text, BASE).splitlines()
+
+    assert lines[0] == "#EXTM3U"
+    assert lines[1] == (
+        '#EXT-X-KEY:METHOD=AES-128,URI="%s",IV=0x1'
+        % proxied_url("https://cdn.example.com/live/key.bin")
+    )
+    assert lines[2] == '#EXT-X-MAP:URI="%s"' % proxied_url("https://cdn.example.com/init.mp4")
+    assert lines[3] == "#EXTINF:4.0,"
+    assert lines[4] == proxied_url("https://cdn.example.com/live/seg1.ts")
+
+
+def test_playlist_uses_final_url_after_redirect(upstream):
+    responses, _ = upstream
+    responses[BASE] = FakeResponse(
+        body=b"#EXTM3U\n#EXTINF:4.0,\nseg1.ts\n",
+        url="https://edge.example.net/v2/master.m3u8",
+    )
+
+    resp = proxy_response(BASE, {})
+
+    assert resp.status_code == 200
+    assert _targets(resp.get_data(as_text=True)) == ["https://edge.example.net/v2/seg1.ts"]
+
+
+# ---------- Caché de playlists y segmentos ----------
+def test_playlist_is_cached_briefly(upstream):
+    responses, calls = upstream
+    responses[BASE] = FakeResponse(body=b"#EXTM3U\n")
+
+    proxy_response(BASE, {})
+    proxy_response(BASE, {})
+
+    assert calls == [BASE]
+
+
+def test_playlist_errors_are_not_cached(upstream):
+    responses, calls = upstream
+    responses[BASE] = FakeResponse(status_code=503, body=b"caido")
+
+    assert proxy_response(BASE, {}).status_code == 503
+
+    responses[BASE] = FakeResponse(body=b"#EXTM3U\n")
+    assert proxy_response(BASE, {}).status_code == 200
+    assert calls == [BASE, BASE]
+
+
+def test_segments_are_shared_but_errors_are_not_cached(upstream):
+    responses, calls = upstream
+    ok = "https://cdn.example.com/live/seg1.ts"
+    broken = "https://cdn.example.com/live/seg2.ts"
+    responses[ok] = FakeResponse(body=b"\x47" * 188, headers={"Content-Type": "video/mp2t"})
+    responses[broken] = FakeResponse(status_code=404, body=b"")
+
+    for _ in range(2):
+        resp = proxy_response(ok, {})
+        assert resp.status_code == 200
+        assert resp.headers["Content-Type"] == "video/mp2t"
+        assert proxy_response(broken, {}).status_code == 404
+
+    assert calls == [ok, broken, broken]
@@ -0,0 +1,160 @@
+import gzip
+
+import pytest
+from flask import Flask, request
+
+import response_cache
+from response_cache import VersionedResponseCache
+
+# Lo bastante grande como para que se comprima
+BODY = "<html>" + "partido " * 200 + "</html>"
+
+
+@pytest.fixture
+def app():
+    return Flask(__name__)
+
+
+def _respond(app, cache, key, render, headers=None):
+    with app.test_request_context("/", headers=headers or {}):
+        return cache.response(key, render, request)
+
+
+def test_renders_once_per_version():
+    cache = VersionedResponseCache("index", "text/html; charset=utf-8")
+    calls = []
+
+    def render():
+        calls.append(1)
+        return BODY
+
+    first = cache.get(1, render)
+    assert cache.get(1, render) is first
+    assert len(calls) == 1
+
+    cache.get(2, render)
+    assert len(calls) == 2
+
+
+def test_identity_response_without_accept_encoding(app):
+    cache = VersionedResponseCache("index", "text/html; charset=utf-8")
+
+    resp = _respond(app, cache, 7, lambda: BODY)
+
+    assert resp.status_code == 200
+    assert resp.get_data(as_text=True) == BODY
+    assert "Content-Encoding" not in resp.headers
+    assert resp.headers["ETag"] == '"index-7"'
+    assert resp.headers["Vary"] == "Accept-Encoding"
+    assert resp.headers["Cache-Control"] == "no-cache"
+    assert resp.content_type == "text/html; charset=utf-8"
+
+
+def test_gzip_variant(app):
+    cache = VersionedResponseCache("index", "text/html; charset=utf-8")
+
+    resp = _respond(app, cache, 7, lambda: BODY, {"Accept-Encoding": "gzip"})
+
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert resp.headers["ETag"] == '"index-7-gzip"'
+    assert gzip.decompress(resp.get_data()).decode() == BODY
+
+
+@pytest.mark.skipif(response_cache.brotli is None, reason="brotli no instalado")
+def test_brotli_preferred_when_accepted(app):
+    cache = VersionedResponseCache("index", "text/html; charset=utf-8")
+
+    resp = _respond(app, cache, 7, lambda: BODY, {"Accept-Encoding": "gzip, br"})
+
+    assert resp.headers["Content-Encoding"] == "br"
+    assert resp.headers["ETag"] == '"index-7-br"'
+    assert response_cache.brotli.decompress(resp.get_data()).decode() == BODY
+
+
+def test_not_modified_with_matching_etag(app):
+    cache = VersionedResponseCache("index", "text/html; charset=utf-8")
+    etag = _respond(app, cache, 7, lambda: BODY, {"Accept-Encoding": "gzip"}).headers["ETag"]
+
+    resp = _respond(app, cache, 7, lambda: BODY, {"Accept-Encoding": "gzip", "If-None-Match": etag})
+
+    assert resp.status_code == 304
+    assert resp.get_data() == b""
+    assert resp.headers["ETag"] == etag
+
+
+def test_etag_of_other_encoding_or_version_is_not_a_match(app):
+    cache = VersionedResponseCache("index", "text/html; charset=utf-8")
+    gzip_etag = _respond(app, cache, 7, lambda: BODY, {"Accept-Encoding": "gzip"}).headers["ETag"]
+
+    # Mismo snapshot pero el cliente ya no acepta gzip
+    assert _respond(app, cache, 7, lambda: BODY, {"If-None-Match": gzip_etag}).status_code == 200
+    # Snapshot nuevo
+    resp = _respond(app, cache, 8, lambda: BODY, {"Accept-Encoding": "gzip", "If-None-Match": gzip_etag})
+    assert resp.status_code == 200
+    assert resp.headers["ETag"] == '"index-8-gzip"'
+
+
+def test_clear_forces_render():
+    cache = VersionedResponseCache("index", "text/html; charset=utf-8")
+    calls = []
+
+    def render():
+        calls.append(1)
+        return BODY
+
+    cache.get(1, render)
+    cache.clear()
+    cache.get(1, render)
+
+    assert len(calls) == 2
+
+
+def test_small_bodies_are_not_compressed(app):
+    cache = VersionedResponseCache("events", "application/json")
+
+    resp = _respond(app, cache, 1, lambda: "[]\n", {"Accept-Encoding": "gzip, br"})
+
+    assert "Content-Encoding" not in resp.headers
+    assert resp.headers["ETag"] == '"events-1"'
+
+
+def test_variants_are_compressed_on_first_request(app):
+    cache = VersionedResponseCache("events", "application/json")
+    cached = cache.get(1, lambda: BODY)
+
+    # Ningún cliente ha pedido todavía una variante comprimida
+    assert set(cached.variants) == {"identity"}
+    assert "gzip" in cached.etags
+
+    # Un 304 no comprime nada: la ETag se conoce sin comprimir
+    etag = f'"{cached.etags["gzip"]}"'
+    resp = _respond(app, cache, 1, lambda: BODY, {"Accept-Encoding": "gzip", "If-None-Match": etag})
+    assert resp.status_code == 304
+    assert set(cached.variants) == {"identity"}
+
+    _respond(app, cache, 1, lambda: BODY, {"Accept-Encoding": "gzip"})
+    assert set(cached.variants) == {"identity", "gzip"}
+
+
+def test_compression_levels_are_configurable():
+    fast = VersionedResponseCache("q", "application/json", gzip_level=1)
+    best = VersionedResponseCache("q", "application/json", gzip_level=9)
+    body = ("evento %d " * 2000) % tuple(range(2000))
+
+    fast_size = len(fast.get(1, lambda: body).variant("gzip"))
+    best_size = len(best.get(1, lambda: body).variant("gzip"))
+
+    assert best_size < fast_size
+    assert gzip.decompress(fast.get(1, lambda: body).variant("gzip")).decode() == body
+
+
+def test_tuple_keys_share_version_prefix_and_differ_by_query():
+    cache = VersionedResponseCache("events-q", "application/json")
+
+    a = cache.get((5, "livetv", "", "barc", 1, 20), lambda: BODY)
+    b = cache.get((5, "livetv", "", "barc", 2, 20), lambda: BODY)
+
+    assert a.etags["identity"].startswith("events-q-5-")
+    assert a.etags["identity"] != b.etags["identity"]
+    # Solo caracteres seguros dentro de la ETag
+    assert a.etags["identity"].replace("-", "").isalnum()
@@ -0,0 +1,123 @@
+import time
+
+import pytest
+
+from scrapers import scheduler as scheduler_module
+from scrapers.base import BaseProvider
+from scrapers.scheduler import LIVE_AFTER, LIVE_BEFORE, MAX_BACKOFF, MIN_INTERVAL, ProviderScheduler
+
+# 2027-01-15 00:30 UTC
+NOW = 1_799_973_000.0
+
+
+class FakeProvider(BaseProvider):
+    name = "Fake"
+    refresh_interval = 100
+    refresh_jitter = 0
+    live_interval = 30
+
+    def fetch_events(self):
+        return []
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    monkeypatch.setattr(scheduler_module.time, "time", lambda: NOW)
+
+
+def _scheduler(provider, fetch=None, results=None):
+    results = [] if results is None else results
+    sched = ProviderScheduler(
+        [provider],
+        fetch=fetch or (lambda p: p.fetch_events()),
+        on_result=lambda p, events: results.append(events),
+    )
+    return sched, sched.schedules[0]
+
+
+# ---------- Intervalos ----------
+@pytest.mark.parametrize("failures, expected", [(1, 200), (2, 400), (4, 1600), (5, MAX_BACKOFF), (20, MAX_BACKOFF)])
+def test_backoff_doubles_up_to_max(failures, expected):
+    scheduler, sched = _scheduler(FakeProvider())
+    sched.failures = failures
+
+    assert scheduler._next_interval(sched) == expected
+
+
+def test_jitter_stays_within_bounds():
+    provider = FakeProvider()
+    provider.refresh_jitter = 15
+    scheduler, sched = _scheduler(provider)
+
+    intervals = [scheduler._next_interval(sched) for _ in range(500)]
+
+    assert all(85 <= i <= 115 for i in intervals)
+    assert max(intervals) - min(intervals) > 15
+
+
+def test_interval_never_below_minimum():
+    provider = FakeProvider()
+    provider.refresh_interval = 1
+    provider.refresh_jitter = 5
+    scheduler, sched = _scheduler(provider)
+
+    assert all(scheduler._next_interval(sched) >= MIN_INTERVAL for _ in range(100))
+
+
+# ---------- Ventana de directo ----------
+@pytest.mark.parametrize("offset, live", [
+    (LIVE_BEFORE - 60, True),
+    (LIVE_BEFORE + 60, False),
+    (-LIVE_AFTER + 60, True),
+    (-LIVE_AFTER - 60, False),
+])
+def test_live_window_from_start_time(clock, make_event, offset, live):
+    scheduler, sched = _scheduler(FakeProvider())
+    sched.events = [make_event("1", start_time=int((NOW + offset) * 1000))]
+
+    assert scheduler._next_interval(sched) == (30 if live else 100)
+
+
+@pytest.mark.parametrize("match_time, live", [
+    ("00:40", True),   # empieza en 10 minutos
+    ("23:30", True),   # de ayer, en juego desde hace una hora
+    ("01:00", False),  # dentro de media hora
+    ("22:00", False),  # terminado
+    ("", False),
+    ("25:00", False),
+])
+def test_live_window_from_match_time(clock, make_event, match_time, live):
+    scheduler, sched = _scheduler(FakeProvider())
+    sched.events = [make_event("1", match_time=match_time)]
+
+    assert scheduler._next_interval(sched) == (30 if live else 100)
+
+
+# ---------- Resultado de cada ejecución ----------
+def test_empty_result_is_success(make_event):
+    results = []
+    scheduler, sched = _scheduler(FakeProvider(), results=results)
+    sched.failures = 3
+    sched.events = [make_event("1")]
+
+    scheduler._run(sched)
+
+    assert results == [[]]
+    assert sched.failures == 0
+    assert sched.events == []
+    assert sched.next_run <= time.monotonic() + 100
+
+
+def test_exception_is_failure_with_backoff():
+    def fetch(provider):
+        raise RuntimeError("caído")
+
+    results = []
+    scheduler, sched = _scheduler(FakeProvider(), fetch=fetch, results=results)
+
+    scheduler._run(sched)
+    scheduler._run(sched)
+
+    assert results == [None, None]
+    assert sched.failures == 2
+    assert sched.next_run > time.monotonic() + 300
@@ -0,0 +1,106 @@
+import pytest
+
+from scrapers.search import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, SearchIndex, paginate
+
+
+@pytest.fixture
+def events(event_dict):
+    return [
+        event_dict("1", "Barcelona", "Real Madrid", league="La Liga", provider="LiveTV"),
+        event_dict("2", "Flamengo", "Palmeiras", league="Serie A", provider="KevinSport"),
+        event_dict("3", "Real Betis", "Sevilla", league="La Liga", provider="KevinSport"),
+        event_dict("4", "Milan", "Inter", league="Serie A", provider="LiveTV", match_time="20:45"),
+    ]
+
+
+@pytest.fixture
+def index(events):
+    return SearchIndex(events)
+
+
+def _ids(events):
+    return [e["id"] for e in events]
+
+
+def test_no_filters_returns_everything_in_order(index):
+    assert _ids(index.query()) == ["1", "2", "3", "4"]
+
+
+def test_provider_and_league_filters_ignore_case(index):
+    assert _ids(index.query(provider="kevinsport")) == ["2", "3"]
+    assert _ids(index.query(league="serie a")) == ["2", "4"]
+    assert _ids(index.query(provider="LiveTV", league="Serie A")) == ["4"]
+    assert index.query(provider="Desconocido") == []
+
+
+def test_query_matches_teams_league_and_time(index):
+    assert _ids(index.query(q="real")) == ["1", "3"]
+    assert _ids(index.query(q="liga")) == ["1", "3"]
+    assert _ids(index.query(q="20:45")) == ["4"]
+
+
+def test_all_terms_must_match(index):
+    assert _ids(index.query(q="real madrid")) == ["1"]
+    assert index.query(q="real palmeiras") == []
+
+
+def test_query_combined_with_filters(index):
+    assert _ids(index.query(provider="KevinSport", q="real")) == ["3"]
+
+
+def test_paginate():
+    items = list(range(45))
+
+    page = paginate(items, page=2, page_size=20)
+
+    assert page == {"items": list(range(20, 40)), "total": 45, "page": 2, "page_size": 20, "pages": 3}
+
+
+def test_paginate_clamps_values():
+    items = list(range(5))
+
+    assert paginate(items)["page_size"] == DEFAULT_PAGE_SIZE
+    assert paginate(items, page=0, page_size=0)["items"] == [0]
+    assert paginate(items, page_size=10_000)["page_size"] == MAX_PAGE_SIZE
+    # Una página más allá del final está vacía pero conserva los totales
+    assert paginate(items, page=9, page_size=2) == {"items": [], "total": 5, "page": 9, "page_size": 2, "pages": 3}
+
+
+def test_paginate_empty():
+    assert paginate([]) == {"items": [], "total": 0, "page": 1, "page_size": DEFAULT_PAGE_SIZE, "pages": 1}
+
+
+def test_terms_match_word_prefixes(index):
+    assert _ids(index.query(q="barc")) == ["1"]
+    assert _ids(index.query(q="pal flam")) == ["2"]
+    # Solo prefijos de palabra, no subcadenas
+    assert index.query(q="elona") == []
+
+
+def test_accents_and_case_are_ignored(event_dict):
+    index = SearchIndex([
+        event_dict("1", "Atlético Madrid", "São Paulo"),
+        event_dict("2", "Bayern München", "Köln"),
+    ])
+
+    assert _ids(index.query(q="atletico")) == ["1"]
+    assert _ids(index.query(q="ATLÉTICO sao")) == ["1"]
+    assert _ids(index.query(q="munchen")) == ["2"]
+    assert _ids(index.query(q="Mün")) == ["2"]
+
+
+def test_punctuation_splits_words(event_dict):
+    index = SearchIndex([event_dict("1", "Flamengo-RJ", "Vasco")])
+
+    assert _ids(index.query(q="rj")) == ["1"]
+    assert _ids(index.query(q="flamengo-rj")) == ["1"]
+
+
+def test_results_keep_snapshot_order_with_many_prefix_matches(event_dict):
+    events = [event_dict(str(i), f"Team{i % 7}", f"Rival{i}") for i in range(50)]
+    index = SearchIndex(events)
+
+    result = index.query(q="team")
+
+    assert _ids(result) == [str(i) for i in range(50)]
+    assert _ids(index.query(q="team3 rival1")) == ["10", "17"]
@@ -0,0 +1,177 @@
+import asyncio
+import json
+import os
+
+import pytest
+
+from scrapers import store as store_module
+from scrapers.base import BaseProvider
+from scrapers.models import merge_events
+from scrapers.service import ScraperService
+from scrapers.store import SegmentStore
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_800_000_000.0]
+    monkeypatch.setattr(store_module.time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return str(tmp_path / "segments"), str(tmp_path / "events.json")
+
+
+def _snapshot(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+# ---------- merge_events ----------
+def test_merge_events_sorts_and_dedupes_by_id_and_league(make_event):
+    events = [
+        make_event("a", start_time=30, provider="P1"),
+        make_event("a", start_time=10, provider="P2"),
+        make_event("a", league="Copa", start_time=20),
+        make_event("b", start_time=0),
+    ]
+
+    merged = merge_events(events)
+
+    assert [(e.id, e.league, e.provider) for e in merged] == [
+        ("b", "Liga", "LiveTV"),
+        ("a", "Liga", "P2"),
+        ("a", "Copa", "LiveTV"),
+    ]
+
+
+def test_merge_events_same_result_for_events_and_dicts(make_event):
+    events = [
+        make_event("a", start_time=5),
+        make_event("a", start_time=1),
+        make_event("b", start_time=3),
+    ]
+
+    from_events = [e.to_dict() for e in merge_events(events)]
+    from_dicts = merge_events([e.to_dict() for e in events])
+
+    assert from_events == from_dicts
+
+
+# ---------- SegmentStore ----------
+def test_update_publishes_merged_snapshot(paths, event_dict):
+    directory, snapshot_path = paths
+    segments = SegmentStore(directory, snapshot_path)
+
+    assert segments.update("A", [event_dict("1", start_time=2)]) is True
+    assert segments.update("B", [event_dict("2", start_time=1)]) is True
+
+    assert [e["id"] for e in _snapshot(snapshot_path)["events"]] == ["2", "1"]
+    assert sorted(os.listdir(directory)) == ["a.json", "b.json"]
+
+
+def test_unchanged_update_does_not_republish(paths, clock, event_dict):
+    directory, snapshot_path = paths
+    segments = SegmentStore(directory, snapshot_path)
+    segments.update("A", [event_dict("1")])
+    version = _snapshot(snapshot_path)["version"]
+
+    clock[0] += 120
+    assert segments.update("A", [event_dict("1")]) is False
+
+    assert _snapshot(snapshot_path)["version"] == version
+    # Pero la verificación queda en disco
+    with open(os.path.join(directory, "a.json"), encoding="utf-8") as f:
+        segment = json.load(f)
+    assert segment["verified_at"] == int(clock[0] * 1000)
+    assert segment["updated_at"] < segment["verified_at"]
+
+
+def test_failed_provider_keeps_segment_until_max_age(paths, clock, event_dict):
+    directory, snapshot_path = paths
+    segments = SegmentStore(directory, snapshot_path, max_age=600)
+    segments.update("A", [event_dict("1")])
+    segments.update("B", [event_dict("2")])
+
+    clock[0] += 599
+    assert segments.mark_failed("A") is False
+    assert len(_snapshot(snapshot_path)["events"]) == 2
+
+    clock[0] += 2
+    assert segments.mark_failed("A") is True
+    assert [e["id"] for e in _snapshot(snapshot_path)["events"]] == ["2"]
+    assert not os.path.exists(os.path.join(directory, "a.json"))
+
+
+def test_empty_result_replaces_segment(paths, event_dict):
+    directory, snapshot_path = paths
+    segments = SegmentStore(directory, snapshot_path)
+    segments.update("A", [event_dict("1")])
+
+    # Un provider sin partidos hoy no es un fallo
+    assert segments.update("A", []) is True
+    assert _snapshot(snapshot_path)["events"] == []
+
+
+def test_revalidation_survives_restart(paths, clock, event_dict):
+    directory, snapshot_path = paths
+    segments = SegmentStore(directory, snapshot_path, max_age=600)
+    segments.update("A", [event_dict("1")])
+
+    # Revalidado poco antes de reiniciar el worker
+    clock[0] += 500
+    segments.update("A", [event_dict("1")])
+
+    clock[0] += 200
+    restarted = SegmentStore(directory, snapshot_path, max_age=600)
+    assert restarted.mark_failed("A") is False
+    assert [e["id"] for e in restarted.merged()] == ["1"]
+
+
+def test_segments_without_verified_at_fall_back_to_updated_at(paths, clock, event_dict):
+    directory, snapshot_path = paths
+    os.makedirs(directory)
+    with open(os.path.join(directory, "a.json"), "w", encoding="utf-8") as f:
+        json.dump({
+            "provider": "A",
+            "version": 1,
+            "updated_at": int((clock[0] - 700) * 1000),
+            "fingerprint": "x",
+            "events": [event_dict("1")],
+        }, f)
+
+    segments = SegmentStore(directory, snapshot_path, max_age=600)
+
+    assert segments.mark_failed("A") is True
+
+
+# ---------- ScraperService ----------
+class StaticProvider(BaseProvider):
+    def __init__(self, name, results):
+        self.name = name
+        self.results = list(results)
+
+    def fetch_events(self):
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+@pytest.mark.parametrize("concurrent", [False, True])
+def test_service_has_no_hidden_last_good_copy(concurrent, make_event):
+    ok = StaticProvider("OK", [[make_event("1")], [make_event("1")], []])
+    flaky = StaticProvider("Flaky", [[make_event("2")], RuntimeError("caído"), []])
+    service = ScraperService([ok, flaky], concurrent=concurrent)
+
+    def build():
+        if concurrent:
+            return asyncio.run(service.build_events_async())
+        return service.build_events()
+
+    assert [e.id for e in build()] == ["1", "2"]
+    # El provider que falla no aporta eventos (SegmentStore decide qué conservar)
+    assert [e.id for e in build()] == ["1"]
+    # Una lista vacía es un resultado válido
+    assert build() == []
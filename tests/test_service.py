@@ -0,0 +1,85 @@
+import asyncio
+import time
+
+import pytest
+
+from benchmarks.fixtures import synthetic_site
+from benchmarks.replay import ReplayClient
+from scrapers.base import AsyncBaseProvider
+from scrapers.providers.kevinsport import KevinsportProvider
+from scrapers.providers.tiroalpalo import TiroalpaloProvider
+from scrapers.service import ScraperService
+
+
+class SleepyProvider(AsyncBaseProvider):
+    def __init__(self, name, delay, events, timeout=None):
+        self.name = name
+        self.delay = delay
+        self.events = events
+        if timeout is not None:
+            self.timeout = timeout
+
+    async def fetch_events_async(self):
+        await asyncio.sleep(self.delay)
+        return self.events
+
+
+def _build(service):
+    started = time.monotonic()
+    events = asyncio.run(service.build_events_async())
+    return [e.id for e in events], time.monotonic() - started
+
+
+def test_slow_provider_is_dropped_at_its_deadline(make_event):
+    fast = SleepyProvider("Fast", 0, [make_event("1")])
+    slow = SleepyProvider("Slow", 5, [make_event("2")])
+    service = ScraperService([fast, slow], provider_timeout=0.1)
+
+    ids, elapsed = _build(service)
+
+    assert ids == ["1"]
+    assert elapsed < 1
+
+
+def test_provider_timeout_attribute_overrides_default(make_event):
+    patient = SleepyProvider("Patient", 0.2, [make_event("1")], timeout=2)
+    service = ScraperService([patient], provider_timeout=0.05)
+
+    assert _build(service)[0] == ["1"]
+
+
+def test_global_deadline_bounds_every_provider(make_event):
+    slow = SleepyProvider("Slow", 5, [make_event("1")], timeout=10)
+    service = ScraperService([slow], provider_timeout=10, global_timeout=0.1)
+
+    ids, elapsed = _build(service)
+
+    assert ids == []
+    assert elapsed < 1
+
+
+def test_fetch_provider_propagates_timeout(make_event):
+    slow = SleepyProvider("Slow", 5, [make_event("1")])
+    service = ScraperService([slow], provider_timeout=0.05)
+
+    with pytest.raises(asyncio.TimeoutError):
+        service.fetch_provider(slow)
+
+
+@pytest.mark.parametrize("provider_cls", [KevinsportProvider, TiroalpaloProvider])
+def test_crawl_deadline_returns_partial_results(provider_cls):
+    def streams(provider, client):
+        provider.http = client
+        started = time.monotonic()
+        events = client.run(provider.fetch_events_async())
+        return sum(len(e.streams) for e in events), time.monotonic() - started
+
+    client = ReplayClient(synthetic_site(), latency=0.005)
+    try:
+        full, elapsed = streams(provider_cls(max_in_flight=4), client)
+        # Sin excepción: lo rastreado antes del deadline se devuelve
+        partial, _ = streams(provider_cls(max_in_flight=4, crawl_deadline=elapsed / 2), client)
+    finally:
+        client.close()
+
+    assert 0 < partial < full
@@ -0,0 +1,220 @@
+import json
+import os
+import stat
+import threading
+
+import pytest
+
+from scrapers.store import SNAPSHOT_FILE_MODE, EventStore, Snapshot, SnapshotRefresher, publish_snapshot
+
+
+def _write(path, data):
+    # Como el worker: fichero nuevo (otro inodo) renombrado sobre el anterior
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+def test_snapshot_indexes_by_id_provider_and_league(event_dict):
+    events = [
+        event_dict("1", provider="LiveTV", league="Liga"),
+        event_dict("2", provider="KevinSport", league="Liga"),
+        event_dict("1", provider="KevinSport", league="Copa"),
+    ]
+    snapshot = Snapshot(events, version=7)
+
+    # Con ids repetidos gana el primero
+    assert snapshot.find("1") is events[0]
+    assert snapshot.find(2) is events[1]
+    assert snapshot.find("3") is None
+    assert snapshot.by_provider["KevinSport"] == [events[1], events[2]]
+    assert snapshot.by_league["Liga"] == [events[0], events[1]]
+    assert snapshot.version == 7
+
+
+def test_event_store_reads_versioned_format(tmp_path, event_dict):
+    path = str(tmp_path / "events.json")
+    _write(path, {"version": 42, "generated_at": 0, "events": [event_dict("1")]})
+
+    store = EventStore(path, check_interval=0)
+
+    assert [e["id"] for e in store.get()] == ["1"]
+    assert store.version == 42
+    assert store.find("1")["id"] == "1"
+
+
+def test_event_store_accepts_legacy_list_format(tmp_path, event_dict):
+    path = str(tmp_path / "events.json")
+    _write(path, [event_dict("1"), event_dict("2")])
+
+    store = EventStore(path, check_interval=0)
+
+    assert [e["id"] for e in store.get()] == ["1", "2"]
+    assert store.version == 1
+
+
+def test_event_store_reloads_only_when_file_changes(tmp_path, event_dict):
+    path = str(tmp_path / "events.json")
+    _write(path, {"version": 1, "events": [event_dict("1")]})
+    store = EventStore(path, check_interval=0)
+
+    first = store.current()
+    assert store.current() is first
+
+    _write(path, {"version": 2, "events": [event_dict("1"), event_dict("2")]})
+    second = store.current()
+    assert second is not first
+    assert second.version == 2
+    assert len(second.events) == 2
+
+
+def test_event_store_respects_check_interval(tmp_path, event_dict):
+    path = str(tmp_path / "events.json")
+    _write(path, {"version": 1, "events": [event_dict("1")]})
+    store = EventStore(path, check_interval=3600)
+    store.get()
+
+    _write(path, {"version": 2, "events": []})
+    assert store.version == 1
+
+    store.invalidate()
+    store.get()
+    assert store.version == 2
+
+
+def test_event_store_keeps_last_snapshot_on_corrupt_file(tmp_path, event_dict):
+    path = str(tmp_path / "events.json")
+    _write(path, {"version": 1, "events": [event_dict("1")]})
+    store = EventStore(path, check_interval=0)
+    store.get()
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{no es json")
+
+    assert [e["id"] for e in store.get()] == ["1"]
+
+
+def test_event_store_without_file_is_empty(tmp_path):
+    store = EventStore(str(tmp_path / "missing.json"), check_interval=0)
+
+    assert store.get() == []
+    assert store.find("1") is None
+
+
+def test_publish_snapshot_writes_versioned_payload(tmp_path, event_dict):
+    path = str(tmp_path / "cache" / "events.json")
+
+    v1 = publish_snapshot(path, [event_dict("1")])
+    v2 = publish_snapshot(path, [event_dict("2")])
+
+    assert v2 > v1
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    assert data["version"] == v2
+    assert [e["id"] for e in data["events"]] == ["2"]
+    # Sin temporales olvidados en el directorio
+    assert os.listdir(tmp_path / "cache") == ["events.json"]
+
+
+def test_publish_snapshot_file_is_readable_by_other_users(tmp_path):
+    path = str(tmp_path / "events.json")
+
+    publish_snapshot(path, [])
+    assert stat.S_IMODE(os.stat(path).st_mode) == SNAPSHOT_FILE_MODE
+
+    # Si el fichero ya existía se conserva su modo
+    os.chmod(path, 0o640)
+    publish_snapshot(path, [])
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+
+
+def test_publish_snapshot_failure_keeps_previous_file(tmp_path, event_dict):
+    path = str(tmp_path / "events.json")
+    publish_snapshot(path, [event_dict("1")])
+
+    with pytest.raises(TypeError):
+        publish_snapshot(path, [{"id": object()}])
+
+    with open(path, encoding="utf-8") as f:
+        assert [e["id"] for e in json.load(f)["events"]] == ["1"]
+    assert os.listdir(tmp_path) == ["events.json"]
+
+
+# ---------- SnapshotRefresher ----------
+def test_concurrent_waiters_share_one_refresh(tmp_path):
+    store = EventStore(str(tmp_path / "events.json"), check_interval=0)
+    release = threading.Event()
+    calls = []
+
+    def refresh():
+        calls.append(1)
+        release.wait(5)
+
+    refresher = SnapshotRefresher(store, refresh)
+    # El refresco no termina hasta que las 8 peticiones lo han pedido
+    triggered = threading.Semaphore(0)
+    trigger = refresher.trigger
+
+    def counted_trigger():
+        done = trigger()
+        triggered.release()
+        return done
+
+    refresher.trigger = counted_trigger
+    results = []
+    waiters = [
+        threading.Thread(target=lambda: results.append(refresher.trigger_and_wait(5)))
+        for _ in range(8)
+    ]
+    for t in waiters:
+        t.start()
+    for _ in waiters:
+        assert triggered.acquire(timeout=5)
+    release.set()
+    for t in waiters:
+        t.join(5)
+
+    assert results == [True] * 8
+    assert len(calls) == 1
+
+
+def test_cooldown_skips_refresh_without_running_it(tmp_path):
+    store = EventStore(str(tmp_path / "events.json"), check_interval=0)
+    calls = []
+    refresher = SnapshotRefresher(store, lambda: calls.append(1), cooldown=3600)
+
+    assert refresher.trigger_and_wait(5) is True
+    assert refresher.trigger() is None
+    assert refresher.trigger_and_wait(5) is False
+    assert len(calls) == 1
+
+    # Pasado el cooldown se vuelve a refrescar
+    refresher.cooldown = 0
+    assert refresher.trigger_and_wait(5) is True
+    assert len(calls) == 2
+
+
+def test_refresh_invalidates_store(tmp_path, event_dict):
+    path = str(tmp_path / "events.json")
+    publish_snapshot(path, [event_dict("1")])
+    store = EventStore(path, check_interval=3600)
+    assert [e["id"] for e in store.get()] == ["1"]
+
+    refresher = SnapshotRefresher(store, lambda: publish_snapshot(path, [event_dict("2")]))
+
+    assert refresher.trigger_and_wait(5) is True
+    # Sin esperar a check_interval: el store relee el snapshot nuevo
+    assert [e["id"] for e in store.get()] == ["2"]
+
+
+def test_failed_refresh_still_releases_waiters(tmp_path):
+    store = EventStore(str(tmp_path / "events.json"), check_interval=0)
+
+    def refresh():
+        raise RuntimeError("caído")
+
+    refresher = SnapshotRefresher(store, refresh, cooldown=0)
+
+    assert refresher.trigger_and_wait(5) is True
+    assert refresher.trigger_and_wait(5) is True
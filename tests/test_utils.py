@@ -0,0 +1,78 @@
+import pytest
+
+from scrapers.utils import (
+    absolute_url,
+    fold_accents,
+    normalize_text,
+    site_root,
+    split_teams,
+    split_time_prefix,
+    text_in_parens,
+    tokenize,
+)
+
+
+@pytest.mark.parametrize("url, base, expected", [
+    ("https://cdn.example.com/a", "https://site.com/x/y", "https://cdn.example.com/a"),
+    ("//cdn.example.com/a", "https://site.com/x/y", "https://cdn.example.com/a"),
+    ("/eventinfo/1", "https://site.com/enx/list/", "https://site.com/eventinfo/1"),
+    ("eventinfo/1", "https://site.com/enx/list/", "https://site.com/eventinfo/1"),
+    ("/a", "https://site.com", "https://site.com/a"),
+    ("a", "https://site.com/", "https://site.com/a"),
+])
+def test_absolute_url(url, base, expected):
+    assert absolute_url(url, base) == expected
+
+
+def test_site_root():
+    assert site_root("https://site.com/a/b?c=1") == "https://site.com"
+    assert site_root("http://site.com") == "http://site.com"
+    assert site_root("/relative") is None
+
+
+@pytest.mark.parametrize("title, expected", [
+    ("Fluminense – Flamengo-RJ", ("Fluminense", "Flamengo-RJ")),
+    ("Boca - River", ("Boca", "River")),
+    ("Milan vs Inter", ("Milan", "Inter")),
+    ("Milan Vs Inter", ("Milan", "Inter")),
+    ("Solo un equipo", ("Solo un equipo", "")),
+])
+def test_split_teams_default_separators(title, expected):
+    assert split_teams(title) == expected
+
+
+def test_split_teams_custom_separators():
+    # Solo se usan los separadores indicados
+    assert split_teams("Real Madrid-Castilla Vs Barça", (" Vs ",)) == ("Real Madrid-Castilla", "Barça")
+    assert split_teams("A - B", (" Vs ",)) == ("A - B", "")
+
+
+@pytest.mark.parametrize("title, expected", [
+    ("23:30 | Home vs Away", ("23:30", "Home vs Away")),
+    ("9:05 - Home vs Away", ("9:05", "Home vs Away")),
+    ("20:00 Home vs Away", ("20:00", "Home vs Away")),
+    ("Home vs Away", (None, "Home vs Away")),
+])
+def test_split_time_prefix(title, expected):
+    assert split_time_prefix(title) == expected
+
+
+def test_text_in_parens():
+    assert text_in_parens("23:30 (Brazil. Serie A)") == "Brazil. Serie A"
+    assert text_in_parens("(a) (b)") == "a"
+    assert text_in_parens("sin paréntesis") == ""
+
+
+def test_normalize_text():
+    assert normalize_text("  LiveTV   ") == "livetv"
+    assert normalize_text("Serie  A") == "serie a"
+
+
+def test_fold_accents():
+    assert fold_accents("Atlético München") == "Atletico Munchen"
+    assert fold_accents("ascii") == "ascii"
+    assert normalize_text("  Atlético   MÜNCHEN ") == "atletico munchen"
+
+
+def test_tokenize():
+    assert tokenize("Flamengo-RJ vs São Paulo (20:00)") == ["flamengo", "rj", "vs", "sao", "paulo", "20", "00"]